@@ -12,103 +12,485 @@ import sys
 import json
 import csv
 import time
-from typing import List, Dict, Optional
+import uuid
+import atexit
+import logging
+import logging.handlers
+import mmap
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 
+from feishu_common import RATE_LIMIT_CODES, RateLimiter, retry_delay, shared_session
+
 try:
     import lark_oapi as lark
     from lark_oapi.api.task.v2 import *
+    import requests
 except ImportError:
     print("Error: lark-oapi not installed. Run: pip install lark-oapi")
     sys.exit(1)
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    _loads = json.loads
+
+
+logger = logging.getLogger(__name__)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _setup_logging(verbose: bool = False):
+    """Route this module's log records to stderr through a background thread
+    
+    Records are handed to a QueueHandler so worker threads never block on
+    terminal writes; a QueueListener drains the queue to a StreamHandler.
+    """
+    global _log_listener
+    log_queue = queue.Queue()
+    _log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    logger.propagate = False
+
+
+def _flush_logging():
+    """Block until every record queued so far has been written out"""
+    if _log_listener is not None:
+        # stop() drains the queue before joining; restart for later records
+        _log_listener.stop()
+        _log_listener.start()
+
+
+def _new_results(key: str, detail: bool) -> Dict[str, Any]:
+    """Results dict with a `<key>_count` counter and a list of failures
+    
+    Successful items are only retained under `key` when `detail` is set;
+    otherwise large batches would keep every returned task alive.
+    """
+    results: Dict[str, Any] = {f"{key}_count": 0, "failed": []}
+    if detail:
+        results[key] = []
+    return results
+
+
+def _record_success(results: Dict[str, Any], key: str, item: Any):
+    results[f"{key}_count"] += 1
+    if key in results:
+        results[key].append(item)
+
+
+def _log_progress(done: int, total: Optional[int] = None, every: int = 100):
+    """Emit a progress line every `every` processed items"""
+    if done % every == 0:
+        logger.info("progress: %d/%s", done, total if total is not None else "?")
+
+
+def _len_or_none(items: Iterable) -> Optional[int]:
+    """Return len(items) for sized collections, None for lazy iterables"""
+    return len(items) if hasattr(items, "__len__") else None
+
+
+def _iter_json_tasks(json_path: str) -> Iterator[Dict]:
+    """Yield task dicts from a JSON array or JSON Lines file
+    
+    `.jsonl` files are parsed line by line. JSON arrays are streamed with
+    ijson when it is installed and fall back to json.load otherwise.
+    """
+    if json_path.endswith(".jsonl"):
+        with open(json_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
+    elif ijson is not None:
+        with open(json_path, 'rb') as f:
+            # use_float: numbers come back as float, not Decimal, as json.load
+            yield from ijson.items(f, "item", use_float=True)
+    else:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+
+
+def _iter_task_ids(path: str) -> Iterator[str]:
+    """Yield task IDs from a file with one ID per line
+    
+    The file is memory-mapped and read line by line, so IDs are handed to
+    the worker pool while the rest of the file is still being read.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                task_id = line.strip()
+                if task_id:
+                    yield task_id.decode("utf-8")
+
 
 class BulkTaskOperations:
-    """Bulk operations for Feishu tasks"""
+    """Bulk operations for Feishu tasks
+    
+    Requests are dispatched concurrently from a thread pool while a shared
+    token bucket keeps the overall request rate under `rate` per second.
+    Clients are cached per app so instances share one connection pool.
+    
+    `raw_http` selects raw REST calls over SDK builders for creates and
+    updates only; deletes and exports always go through `_request` so they
+    share its retry/backoff handling.
+    """
     
-    def __init__(self, app_id: Optional[str] = None, app_secret: Optional[str] = None):
+    _clients: Dict[Tuple[str, str], "lark.Client"] = {}
+    _clients_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        app_secret: Optional[str] = None,
+        rate: float = 5.0,
+        max_workers: int = 16,
+        raw_http: bool = True
+    ):
         self.app_id = app_id or os.getenv("FEISHU_APP_ID")
         self.app_secret = app_secret or os.getenv("FEISHU_APP_SECRET")
         
         if not self.app_id or not self.app_secret:
             raise ValueError("App credentials required")
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate:g}")
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        
+        self.client = self._get_client(self.app_id, self.app_secret)
+        self.max_workers = max_workers
+        self.raw_http = raw_http
+        self._limiter = RateLimiter(rate)
+        self._token: Optional[str] = None
+        self._token_exp = 0.0
+        self._token_lock = threading.Lock()
+    
+    @classmethod
+    def _get_client(cls, app_id: str, app_secret: str) -> "lark.Client":
+        """Return the shared lark client for this app, building it once"""
+        key = (app_id, app_secret)
+        with cls._clients_lock:
+            client = cls._clients.get(key)
+            if client is None:
+                shared_session()
+                client = lark.Client.builder() \
+                    .app_id(app_id) \
+                    .app_secret(app_secret) \
+                    .log_level(lark.LogLevel.WARNING) \
+                    .build()
+                cls._clients[key] = client
+            return client
+    
+    def _auth_headers(self) -> Dict[str, str]:
+        """Return request headers carrying a cached tenant_access_token
+        
+        The token is fetched once and refreshed 5 minutes before it expires.
+        Transport errors, non-200 responses and undecodable bodies raise
+        RuntimeError, as `_request` does.
+        """
+        with self._token_lock:
+            if self._token is None or time.time() >= self._token_exp - 300:
+                try:
+                    response = shared_session().post(
+                        f"{lark.FEISHU_DOMAIN}/open-apis/auth/v3/tenant_access_token/internal",
+                        data=_dumps({"app_id": self.app_id, "app_secret": self.app_secret}),
+                        headers={"Content-Type": "application/json; charset=utf-8"},
+                        timeout=10
+                    )
+                except requests.RequestException as e:
+                    raise RuntimeError(f"tenant_access_token: {e}") from e
+                
+                if response.status_code != 200:
+                    raise RuntimeError(f"tenant_access_token: HTTP {response.status_code}")
+                try:
+                    data = _loads(response.content)
+                except ValueError:
+                    data = None
+                if not isinstance(data, dict):
+                    raise RuntimeError("tenant_access_token: unexpected non-JSON response")
+                if data.get("code") != 0:
+                    raise RuntimeError(f"{data.get('code')}: {data.get('msg')}")
+                self._token = data["tenant_access_token"]
+                self._token_exp = time.time() + data.get("expire", 7200)
+            return {
+                "Authorization": f"Bearer {self._token}",
+                "Content-Type": "application/json; charset=utf-8"
+            }
+    
+    def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        max_attempts: int = 5
+    ) -> Dict:
+        """Call /open-apis/<path> and return the response's `data` dict
+        
+        HTTP 429/5xx and Feishu rate-limit codes are retried with exponential
+        backoff and jitter, honouring Retry-After when the server sends it.
+        A server-advertised rate limit lowers the shared limiter. Raises
+        RuntimeError once the error is final or attempts are exhausted.
+        Non-idempotent calls must carry a client_token so a retry after a
+        5xx cannot apply them twice.
+        """
+        url = f"{lark.FEISHU_DOMAIN}/open-apis/{path}"
+        for attempt in range(max_attempts):
+            if attempt:
+                self._limiter.acquire()
+            
+            try:
+                response = shared_session().request(
+                    method,
+                    url,
+                    params=params,
+                    data=_dumps(payload) if payload is not None else None,
+                    headers=self._auth_headers(),
+                    timeout=30
+                )
+            except requests.RequestException as e:
+                raise RuntimeError(f"{method} {path}: {e}") from e
+            
+            limit = response.headers.get("X-Ogw-Ratelimit-Limit") \
+                or response.headers.get("X-RateLimit-Limit")
+            if limit:
+                try:
+                    self._limiter.limit_to(float(limit))
+                except ValueError:
+                    pass
+            
+            code = None
+            if response.status_code < 500 and response.status_code != 429:
+                try:
+                    result = _loads(response.content)
+                except ValueError:
+                    result = None
+                if not isinstance(result, dict):
+                    raise RuntimeError(
+                        f"HTTP {response.status_code}: unexpected non-JSON response"
+                    )
+                code = result.get("code")
+                if code == 0:
+                    return result.get("data") or {}
+                if code not in RATE_LIMIT_CODES:
+                    raise RuntimeError(f"{code}: {result.get('msg')}")
+            
+            if attempt == max_attempts - 1:
+                break
+            time.sleep(retry_delay(response, attempt))
         
-        self.client = lark.Client.builder() \
-            .app_id(self.app_id) \
-            .app_secret(self.app_secret) \
-            .log_level(lark.LogLevel.WARNING) \
+        raise RuntimeError(
+            f"{code if code is not None else response.status_code}: "
+            f"giving up after {max_attempts} attempts"
+        )
+    
+    def _create_task(self, payload: Dict) -> Dict:
+        """Create a task from a raw request-body dict and return it as a dict
+        
+        Posts straight to the REST endpoint unless `raw_http` is off, in which
+        case the SDK builders are used. Raises RuntimeError on API errors.
+        A client_token is added so retried creates are deduplicated.
+        """
+        payload = {**payload, "client_token": payload.get("client_token") or str(uuid.uuid4())}
+        if self.raw_http:
+            return self._request("POST", "task/v2/tasks", payload)["task"]
+        
+        body = CreateTaskRequestBody.builder()
+        for field, value in payload.items():
+            body = getattr(body, field)(value)
+        request = CreateTaskRequest.builder() \
+            .request_body(body.build()) \
             .build()
+        response = self.client.task.v2.task.create(request)
+        if not response.success():
+            raise RuntimeError(f"{response.code}: {response.msg}")
+        return json.loads(lark.JSON.marshal(response.data.task))
+    
+    def _run_pipeline(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        buffer_size: int,
+        results: Dict[str, Any]
+    ) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+        """Call fn(item) for every item from a producer/consumer pipeline
+        
+        A producer thread pulls `items` (parsing input files as it goes) into
+        a queue bounded at `buffer_size`, while `max_workers` consumer threads
+        drain it, each waiting on the rate limiter before calling fn. Parsing
+        and HTTP submission therefore overlap. Yields (item, result, error)
+        tuples in completion order; exactly one of result/error is set.
+        
+        An exception raised while producing items (e.g. malformed input
+        halfway through a file) stops production; items already queued are
+        still submitted and the error is recorded as results["error"] so the
+        caller keeps its partial counts.
+        """
+        pending: queue.Queue = queue.Queue(maxsize=buffer_size)
+        outcomes: queue.Queue = queue.Queue()
+        done = object()
+        producer_errors: List[Exception] = []
+        
+        def produce():
+            try:
+                for item in items:
+                    pending.put(item)
+            except Exception as e:
+                producer_errors.append(e)
+            finally:
+                for _ in range(self.max_workers):
+                    pending.put(done)
+        
+        def consume():
+            try:
+                while True:
+                    item = pending.get()
+                    if item is done:
+                        return
+                    try:
+                        self._limiter.acquire()
+                        outcomes.put((item, fn(item), None))
+                    except Exception as e:
+                        outcomes.put((item, None, e))
+            finally:
+                # Always signal, or the collector below would wait forever
+                outcomes.put(done)
+        
+        threads = [threading.Thread(target=produce, daemon=True)]
+        threads += [
+            threading.Thread(target=consume, daemon=True)
+            for _ in range(self.max_workers)
+        ]
+        for thread in threads:
+            thread.start()
+        
+        finished = 0
+        while finished < self.max_workers:
+            outcome = outcomes.get()
+            if outcome is done:
+                finished += 1
+            else:
+                yield outcome
+        
+        if producer_errors:
+            error = producer_errors[0]
+            results["error"] = f"{type(error).__name__}: {error}"
+            logger.error("Stopped reading input: %s", results["error"])
+    
+    def _import_tasks(
+        self,
+        items: Iterator[Any],
+        to_payload: Callable[[Any], Dict],
+        describe: Callable[[Any], Dict],
+        tasklist_id: Optional[str],
+        chunk_size: int,
+        detail: bool
+    ) -> Dict[str, Any]:
+        """Create one task per item, buffering at most `chunk_size` items
+        
+        `to_payload` turns an item into a create-task request body and
+        `describe` turns it into the dict recorded for failed items. Tasks
+        are placed in `tasklist_id` as part of the create call itself.
+        """
+        results = _new_results("created", detail)
+        tasklists = [{"tasklist_id": tasklist_id}] if tasklist_id else None
+        
+        def create(item):
+            # Built on the worker so a malformed item fails on its own
+            payload = to_payload(item)
+            if tasklists:
+                payload["tasklists"] = tasklists
+            return self._create_task(payload)
+        
+        for item, task, error in self._run_pipeline(create, items, chunk_size, results):
+            if error is not None:
+                failure = describe(item)
+                results["failed"].append({**failure, "error": str(error)})
+                logger.warning("❌ Failed: %s - %s", failure, error)
+            else:
+                _record_success(results, "created", task)
+                logger.debug("✅ Created: %s (%s)", task.get("summary"), task.get("task_id"))
+            _log_progress(results["created_count"] + len(results["failed"]))
+        
+        return results
     
     def import_from_csv(
         self,
         csv_path: str,
         tasklist_id: Optional[str] = None,
-        default_assignee: Optional[str] = None
-    ) -> Dict[str, List]:
+        default_assignee: Optional[str] = None,
+        chunk_size: int = 1000,
+        detail: bool = False
+    ) -> Dict[str, Any]:
         """Import tasks from CSV file
         
         CSV format:
         title,description,assignee,due_date,status
         Task 1,Desc 1,ou_xxx,2024-12-31,todo
         Task 2,Desc 2,ou_yyy,2024-12-31,in_progress
-        """
-        results = {"created": [], "failed": []}
         
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    # Build request
-                    body = CreateTaskRequestBody.builder() \
-                        .summary(row.get("title", "Untitled"))
-                    
-                    if row.get("description"):
-                        body = body.description(row["description"])
-                    
-                    assignee = row.get("assignee") or default_assignee
-                    if assignee:
-                        body = body.assignee(assignee)
-                    
-                    if row.get("due_date"):
-                        due_time = f"{row['due_date']}T23:59:59+08:00"
-                        body = body.due_time(due_time)
-                    
-                    request = CreateTaskRequest.builder() \
-                        .request_body(body.build()) \
-                        .build()
-                    
-                    response = self.client.task.v2.task.create(request)
-                    
-                    if response.success():
-                        task = response.data.task
-                        results["created"].append(task)
-                        
-                        # Add to tasklist if specified
-                        if tasklist_id:
-                            self._add_to_tasklist(tasklist_id, task.task_id)
-                        
-                        print(f"✅ Created: {task.summary} ({task.task_id})")
-                    else:
-                        results["failed"].append({
-                            "row": row,
-                            "error": f"{response.code}: {response.msg}"
-                        })
-                        print(f"❌ Failed: {row.get('title')} - {response.msg}")
-                    
-                    # Rate limiting
-                    time.sleep(0.2)
-                    
-                except Exception as e:
-                    results["failed"].append({"row": row, "error": str(e)})
-                    print(f"❌ Error: {row.get('title')} - {e}")
-        
-        return results
+        Rows are parsed on a producer thread while workers submit them, with
+        at most `chunk_size` parsed rows buffered ahead of the workers. Returns
+        created_count and failed rows; created tasks are listed under
+        "created" only when `detail` is set. If the file cannot be read to
+        the end, results["error"] describes why.
+        """
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            idx = {name: i for i, name in enumerate(header)}
+            
+            def get(row, name, default=""):
+                i = idx.get(name)
+                return row[i] if i is not None and i < len(row) else default
+            
+            def to_payload(row):
+                payload = {"summary": get(row, "title", "Untitled")}
+                description = get(row, "description")
+                if description:
+                    payload["description"] = description
+                assignee = get(row, "assignee") or default_assignee
+                if assignee:
+                    payload["assignee"] = assignee
+                due_date = get(row, "due_date")
+                if due_date:
+                    payload["due_time"] = f"{due_date}T23:59:59+08:00"
+                return payload
+            
+            return self._import_tasks(
+                reader,
+                to_payload,
+                lambda row: {"row": dict(zip(header, row))},
+                tasklist_id,
+                chunk_size,
+                detail
+            )
     
     def import_from_json(
         self,
         json_path: str,
-        tasklist_id: Optional[str] = None
-    ) -> Dict[str, List]:
+        tasklist_id: Optional[str] = None,
+        chunk_size: int = 1000,
+        detail: bool = False
+    ) -> Dict[str, Any]:
         """Import tasks from JSON file
         
         JSON format:
@@ -121,199 +503,147 @@ class BulkTaskOperations:
             "status": "todo"
           }
         ]
+        
+        JSON Lines (`.jsonl`, one task object per line) is also accepted.
+        Tasks are parsed incrementally on a producer thread, with at most
+        `chunk_size` parsed tasks buffered ahead of the workers.
+        Results are shaped as for import_from_csv.
         """
-        results = {"created": [], "failed": []}
+        def to_payload(task_data):
+            payload = {"summary": task_data.get("title", "Untitled")}
+            for field in ("description", "assignee", "due_time"):
+                if task_data.get(field):
+                    payload[field] = task_data[field]
+            return payload
         
-        with open(json_path, 'r', encoding='utf-8') as f:
-            tasks = json.load(f)
+        return self._import_tasks(
+            _iter_json_tasks(json_path),
+            to_payload,
+            lambda task_data: {"data": task_data},
+            tasklist_id,
+            chunk_size,
+            detail
+        )
+    
+    def _bulk_update_batch(
+        self,
+        payloads: Iterable[Dict],
+        batch_size: int = 50,
+        total: Optional[int] = None,
+        detail: bool = False
+    ) -> Dict[str, Any]:
+        """Apply {"task_id", "body"} updates concurrently
         
-        for task_data in tasks:
-            try:
-                body = CreateTaskRequestBody.builder() \
-                    .summary(task_data.get("title", "Untitled"))
-                
-                if task_data.get("description"):
-                    body = body.description(task_data["description"])
-                if task_data.get("assignee"):
-                    body = body.assignee(task_data["assignee"])
-                if task_data.get("due_time"):
-                    body = body.due_time(task_data["due_time"])
-                
-                request = CreateTaskRequest.builder() \
-                    .request_body(body.build()) \
-                    .build()
-                
-                response = self.client.task.v2.task.create(request)
-                
-                if response.success():
-                    task = response.data.task
-                    results["created"].append(task)
-                    
-                    if tasklist_id:
-                        self._add_to_tasklist(tasklist_id, task.task_id)
-                    
-                    print(f"✅ Created: {task.summary}")
-                else:
-                    results["failed"].append({
-                        "data": task_data,
-                        "error": f"{response.code}: {response.msg}"
-                    })
-                    print(f"❌ Failed: {task_data.get('title')}")
-                
-                time.sleep(0.2)
-                
-            except Exception as e:
-                results["failed"].append({"data": task_data, "error": str(e)})
-                print(f"❌ Error: {task_data.get('title')} - {e}")
+        Task API v2 has no native batch-update endpoint, so updates are fed
+        to the worker pool (at most `batch_size` queued ahead) and per-item
+        outcomes are counted in results["updated_count"] (and listed under
+        results["updated"] when `detail` is set) or kept in results["failed"].
+        `body` is a raw request-body dict and may be shared by all payloads;
+        it is serialised per request and never mutated. `payloads` may be a
+        lazy iterable; `total` is only used for progress output.
+        """
+        results = _new_results("updated", detail)
+        sdk_bodies: Dict[Tuple, Any] = {}
+        
+        def sdk_body(body):
+            key = tuple(sorted(body.items()))
+            built = sdk_bodies.get(key)
+            if built is None:
+                builder = UpdateTaskRequestBody.builder()
+                for field, value in body.items():
+                    builder = getattr(builder, field)(value)
+                built = sdk_bodies[key] = builder.build()
+            return built
+        
+        def update(payload):
+            task_id = payload["task_id"]
+            if self.raw_http:
+                return self._request("PATCH", f"task/v2/tasks/{task_id}", payload["body"])
+            
+            request = UpdateTaskRequest.builder() \
+                .task_id(task_id) \
+                .request_body(sdk_body(payload["body"])) \
+                .build()
+            response = self.client.task.v2.task.update(request)
+            if not response.success():
+                raise RuntimeError(f"{response.code}: {response.msg}")
+            return response.data
+        
+        for payload, _, error in self._run_pipeline(update, payloads, batch_size, results):
+            task_id = payload["task_id"]
+            if error is not None:
+                results["failed"].append({"task_id": task_id, "error": str(error)})
+                logger.warning("❌ Failed: %s - %s", task_id, error)
+            else:
+                _record_success(results, "updated", task_id)
+                logger.debug("✅ Updated: %s", task_id)
+            _log_progress(results["updated_count"] + len(results["failed"]), total)
         
         return results
     
     def bulk_assign(
         self,
-        task_ids: List[str],
+        task_ids: Iterable[str],
         assignee: str,
-        delay: float = 0.2
-    ) -> Dict[str, List]:
+        detail: bool = False
+    ) -> Dict[str, Any]:
         """Bulk assign tasks to a user"""
-        results = {"updated": [], "failed": []}
-        
-        for task_id in task_ids:
-            try:
-                request = UpdateTaskRequest.builder() \
-                    .task_id(task_id) \
-                    .request_body(
-                        UpdateTaskRequestBody.builder()
-                        .assignee(assignee)
-                        .build()
-                    ) \
-                    .build()
-                
-                response = self.client.task.v2.task.update(request)
-                
-                if response.success():
-                    results["updated"].append(task_id)
-                    print(f"✅ Assigned: {task_id}")
-                else:
-                    results["failed"].append({
-                        "task_id": task_id,
-                        "error": f"{response.code}: {response.msg}"
-                    })
-                    print(f"❌ Failed: {task_id} - {response.msg}")
-                
-                time.sleep(delay)
-                
-            except Exception as e:
-                results["failed"].append({"task_id": task_id, "error": str(e)})
-                print(f"❌ Error: {task_id} - {e}")
-        
-        return results
+        body = {"assignee": assignee}
+        return self._bulk_update_batch(
+            ({"task_id": task_id, "body": body} for task_id in task_ids),
+            total=_len_or_none(task_ids),
+            detail=detail
+        )
     
     def bulk_update_status(
         self,
-        task_ids: List[str],
+        task_ids: Iterable[str],
         status: str,
-        delay: float = 0.2
-    ) -> Dict[str, List]:
+        detail: bool = False
+    ) -> Dict[str, Any]:
         """Bulk update task status"""
-        results = {"updated": [], "failed": []}
-        
-        for task_id in task_ids:
-            try:
-                request = UpdateTaskRequest.builder() \
-                    .task_id(task_id) \
-                    .request_body(
-                        UpdateTaskRequestBody.builder()
-                        .status(status)
-                        .build()
-                    ) \
-                    .build()
-                
-                response = self.client.task.v2.task.update(request)
-                
-                if response.success():
-                    results["updated"].append(task_id)
-                    print(f"✅ Updated: {task_id} -> {status}")
-                else:
-                    results["failed"].append({
-                        "task_id": task_id,
-                        "error": f"{response.code}: {response.msg}"
-                    })
-                    print(f"❌ Failed: {task_id}")
-                
-                time.sleep(delay)
-                
-            except Exception as e:
-                results["failed"].append({"task_id": task_id, "error": str(e)})
-        
-        return results
+        body = {"status": status}
+        return self._bulk_update_batch(
+            ({"task_id": task_id, "body": body} for task_id in task_ids),
+            total=_len_or_none(task_ids),
+            detail=detail
+        )
     
     def bulk_set_due_date(
         self,
-        task_ids: List[str],
+        task_ids: Iterable[str],
         due_date: str,
-        delay: float = 0.2
-    ) -> Dict[str, List]:
+        detail: bool = False
+    ) -> Dict[str, Any]:
         """Bulk set due date for tasks"""
-        results = {"updated": [], "failed": []}
-        due_time = f"{due_date}T23:59:59+08:00"
-        
-        for task_id in task_ids:
-            try:
-                request = UpdateTaskRequest.builder() \
-                    .task_id(task_id) \
-                    .request_body(
-                        UpdateTaskRequestBody.builder()
-                        .due_time(due_time)
-                        .build()
-                    ) \
-                    .build()
-                
-                response = self.client.task.v2.task.update(request)
-                
-                if response.success():
-                    results["updated"].append(task_id)
-                    print(f"✅ Updated due date: {task_id}")
-                else:
-                    results["failed"].append({
-                        "task_id": task_id,
-                        "error": f"{response.code}: {response.msg}"
-                    })
-                    print(f"❌ Failed: {task_id}")
-                
-                time.sleep(delay)
-                
-            except Exception as e:
-                results["failed"].append({"task_id": task_id, "error": str(e)})
-        
-        return results
+        body = {"due_time": f"{due_date}T23:59:59+08:00"}
+        return self._bulk_update_batch(
+            ({"task_id": task_id, "body": body} for task_id in task_ids),
+            total=_len_or_none(task_ids),
+            detail=detail
+        )
     
     def bulk_delete(
         self,
-        task_ids: List[str],
-        delay: float = 0.2
-    ) -> Dict[str, List]:
-        """Bulk delete tasks"""
-        results = {"deleted": [], "failed": []}
+        task_ids: Iterable[str],
+        batch_size: int = 50,
+        detail: bool = False
+    ) -> Dict[str, Any]:
+        """Bulk delete tasks (always via raw `_request`, whatever `raw_http` is)"""
+        results = _new_results("deleted", detail)
+        total = _len_or_none(task_ids)
         
-        for task_id in task_ids:
-            try:
-                request = DeleteTaskRequest.builder().task_id(task_id).build()
-                response = self.client.task.v2.task.delete(request)
-                
-                if response.success():
-                    results["deleted"].append(task_id)
-                    print(f"✅ Deleted: {task_id}")
-                else:
-                    results["failed"].append({
-                        "task_id": task_id,
-                        "error": f"{response.code}: {response.msg}"
-                    })
-                    print(f"❌ Failed: {task_id}")
-                
-                time.sleep(delay)
-                
-            except Exception as e:
-                results["failed"].append({"task_id": task_id, "error": str(e)})
+        def delete(task_id):
+            return self._request("DELETE", f"task/v2/tasks/{task_id}")
+        
+        for task_id, _, error in self._run_pipeline(delete, task_ids, batch_size, results):
+            if error is not None:
+                results["failed"].append({"task_id": task_id, "error": str(error)})
+                logger.warning("❌ Failed: %s - %s", task_id, error)
+            else:
+                _record_success(results, "deleted", task_id)
+                logger.debug("✅ Deleted: %s", task_id)
+            _log_progress(results["deleted_count"] + len(results["failed"]), total)
         
         return results
     
@@ -322,73 +652,94 @@ class BulkTaskOperations:
         tasklist_id: Optional[str] = None,
         output_path: Optional[str] = None
     ) -> str:
-        """Export tasks to CSV"""
+        """Export tasks to CSV
+        
+        Follows page_token until every page is exported. Rows are written as
+        each page arrives while the next page is fetched in the background;
+        pages are fetched through `_request`, so throttled calls are retried.
+        """
         if not output_path:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = f"tasks_export_{timestamp}.csv"
         
-        # Get tasks
         if tasklist_id:
-            request = ListTaskTasklistRequest.builder() \
-                .tasklist_id(tasklist_id) \
-                .page_size(100) \
-                .build()
-            response = self.client.task.v2.tasklist.list_task(request)
+            path, filters = f"task/v2/tasklists/{tasklist_id}/tasks", {}
         else:
-            request = ListTaskRequest.builder() \
-                .assigned_to_me(True) \
-                .page_size(100) \
-                .build()
-            response = self.client.task.v2.task.list(request)
+            path, filters = "task/v2/tasks", {"assigned_to_me": "true"}
         
-        if not response.success():
-            print(f"Error: {response.code} - {response.msg}")
-            return ""
+        def fetch(page_token):
+            params = {**filters, "page_size": 100}
+            if page_token:
+                params["page_token"] = page_token
+            return self._request("GET", path, params=params)
         
-        tasks = response.data.items
+        count = 0
+        failed = False
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "task_id", "summary", "description", "status",
-                "assignee", "due_time", "created_time", "url"
-            ])
-            
-            for task in tasks:
+        # Written aside and swapped in only once every page has arrived, so a
+        # failed export leaves any existing file at output_path untouched
+        tmp_path = f"{output_path}.tmp"
+        try:
+            with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=8 * 1024 * 1024) as f, \
+                    ThreadPoolExecutor(max_workers=1) as pool:
+                writer = csv.writer(f)
                 writer.writerow([
-                    task.task_id,
-                    task.summary,
-                    task.description or "",
-                    task.status,
-                    task.assignee or "",
-                    task.due_time or "",
-                    task.created_time,
-                    task.url
+                    "task_id", "summary", "description", "status",
+                    "assignee", "due_time", "created_time", "url"
                 ])
+                
+                future = pool.submit(fetch, None)
+                while future is not None:
+                    try:
+                        data = future.result()
+                    except RuntimeError as e:
+                        logger.error("Error: %s", e)
+                        failed = True
+                        break
+                    
+                    page_token = data.get("page_token")
+                    future = pool.submit(fetch, page_token) \
+                        if data.get("has_more") and page_token else None
+                    
+                    tasks = data.get("items") or []
+                    writer.writerows(
+                        [
+                            task.get("task_id"),
+                            task.get("summary"),
+                            task.get("description") or "",
+                            task.get("status"),
+                            task.get("assignee") or "",
+                            task.get("due_time") or "",
+                            task.get("created_time"),
+                            task.get("url")
+                        ]
+                        for task in tasks
+                    )
+                    count += len(tasks)
+                    logger.debug("exported %d tasks", count)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         
-        print(f"✅ Exported {len(tasks)} tasks to {output_path}")
+        if failed:
+            os.remove(tmp_path)
+            return ""
+        
+        os.replace(tmp_path, output_path)
+        
+        print(f"✅ Exported {count} tasks to {output_path}")
         return output_path
-    
-    def _add_to_tasklist(self, tasklist_id: str, task_id: str):
-        """Helper to add task to tasklist"""
-        try:
-            request = AddTaskTasklistRequest.builder() \
-                .tasklist_id(tasklist_id) \
-                .request_body(
-                    AddTaskTasklistRequestBody.builder()
-                    .task_id(task_id)
-                    .build()
-                ) \
-                .build()
-            self.client.task.v2.tasklist.add_task(request)
-        except:
-            pass
 
 
 if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description="Bulk Feishu Task Operations")
+    parser.add_argument("--rate", type=float, default=5.0, help="Max API requests per second")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent API requests")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log every processed task")
+    parser.add_argument("--sdk", action="store_true", help="Create and update tasks via SDK builders instead of raw HTTP (deletes and exports always use raw HTTP)")
     subparsers = parser.add_subparsers(dest="command")
     
     # Import CSV
@@ -396,30 +747,40 @@ if __name__ == "__main__":
     import_csv.add_argument("--file", required=True, help="CSV file path")
     import_csv.add_argument("--tasklist", help="Add to tasklist")
     import_csv.add_argument("--default-assignee", help="Default assignee")
+    import_csv.add_argument("--chunk-size", type=int, default=1000, help="Max parsed rows buffered ahead of workers")
     
     # Import JSON
-    import_json = subparsers.add_parser("import-json", help="Import from JSON")
+    import_json = subparsers.add_parser("import-json", help="Import from JSON/JSONL")
     import_json.add_argument("--file", required=True, help="JSON file path")
     import_json.add_argument("--tasklist", help="Add to tasklist")
+    import_json.add_argument("--chunk-size", type=int, default=1000, help="Max parsed tasks buffered ahead of workers")
     
     # Bulk assign
     bulk_assign = subparsers.add_parser("bulk-assign", help="Bulk assign tasks")
-    bulk_assign.add_argument("--tasks", required=True, nargs="+", help="Task IDs")
+    bulk_assign_ids = bulk_assign.add_mutually_exclusive_group(required=True)
+    bulk_assign_ids.add_argument("--tasks", nargs="+", help="Task IDs")
+    bulk_assign_ids.add_argument("--tasks-file", help="File with one task ID per line")
     bulk_assign.add_argument("--assignee", required=True, help="Assignee open_id")
     
     # Bulk status
     bulk_status = subparsers.add_parser("bulk-status", help="Bulk update status")
-    bulk_status.add_argument("--tasks", required=True, nargs="+", help="Task IDs")
+    bulk_status_ids = bulk_status.add_mutually_exclusive_group(required=True)
+    bulk_status_ids.add_argument("--tasks", nargs="+", help="Task IDs")
+    bulk_status_ids.add_argument("--tasks-file", help="File with one task ID per line")
     bulk_status.add_argument("--status", required=True, choices=["todo", "in_progress", "completed"])
     
     # Bulk due date
     bulk_due = subparsers.add_parser("bulk-due", help="Bulk set due date")
-    bulk_due.add_argument("--tasks", required=True, nargs="+", help="Task IDs")
+    bulk_due_ids = bulk_due.add_mutually_exclusive_group(required=True)
+    bulk_due_ids.add_argument("--tasks", nargs="+", help="Task IDs")
+    bulk_due_ids.add_argument("--tasks-file", help="File with one task ID per line")
     bulk_due.add_argument("--date", required=True, help="Due date (YYYY-MM-DD)")
     
     # Bulk delete
     bulk_delete = subparsers.add_parser("bulk-delete", help="Bulk delete tasks")
-    bulk_delete.add_argument("--tasks", required=True, nargs="+", help="Task IDs")
+    bulk_delete_ids = bulk_delete.add_mutually_exclusive_group(required=True)
+    bulk_delete_ids.add_argument("--tasks", nargs="+", help="Task IDs")
+    bulk_delete_ids.add_argument("--tasks-file", help="File with one task ID per line")
     
     # Export
     export = subparsers.add_parser("export", help="Export tasks to CSV")
@@ -432,35 +793,63 @@ if __name__ == "__main__":
         parser.print_help()
         sys.exit(1)
     
+    _setup_logging(args.verbose)
+    
+    task_ids = None
+    if getattr(args, "tasks", None):
+        task_ids = args.tasks
+    elif getattr(args, "tasks_file", None):
+        # _iter_task_ids opens the file lazily on the producer thread; check
+        # it up front so a bad path is reported before any work starts
+        try:
+            open(args.tasks_file, 'rb').close()
+        except OSError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        task_ids = _iter_task_ids(args.tasks_file)
+    
     try:
-        ops = BulkTaskOperations()
+        ops = BulkTaskOperations(
+            rate=args.rate, max_workers=args.workers, raw_http=not args.sdk
+        )
     except ValueError as e:
         print(f"Error: {e}")
         sys.exit(1)
     
+    summary = None
     if args.command == "import-csv":
-        results = ops.import_from_csv(args.file, args.tasklist, args.default_assignee)
-        print(f"\nSummary: {len(results['created'])} created, {len(results['failed'])} failed")
+        results = ops.import_from_csv(
+            args.file, args.tasklist, args.default_assignee, args.chunk_size
+        )
+        summary = f"\nSummary: {results['created_count']} created, {len(results['failed'])} failed"
     
     elif args.command == "import-json":
-        results = ops.import_from_json(args.file, args.tasklist)
-        print(f"\nSummary: {len(results['created'])} created, {len(results['failed'])} failed")
+        results = ops.import_from_json(args.file, args.tasklist, args.chunk_size)
+        summary = f"\nSummary: {results['created_count']} created, {len(results['failed'])} failed"
     
     elif args.command == "bulk-assign":
-        results = ops.bulk_assign(args.tasks, args.assignee)
-        print(f"\nSummary: {len(results['updated'])} updated, {len(results['failed'])} failed")
+        results = ops.bulk_assign(task_ids, args.assignee)
+        summary = f"\nSummary: {results['updated_count']} updated, {len(results['failed'])} failed"
     
     elif args.command == "bulk-status":
-        results = ops.bulk_update_status(args.tasks, args.status)
-        print(f"\nSummary: {len(results['updated'])} updated, {len(results['failed'])} failed")
+        results = ops.bulk_update_status(task_ids, args.status)
+        summary = f"\nSummary: {results['updated_count']} updated, {len(results['failed'])} failed"
     
     elif args.command == "bulk-due":
-        results = ops.bulk_set_due_date(args.tasks, args.date)
-        print(f"\nSummary: {len(results['updated'])} updated, {len(results['failed'])} failed")
+        results = ops.bulk_set_due_date(task_ids, args.date)
+        summary = f"\nSummary: {results['updated_count']} updated, {len(results['failed'])} failed"
     
     elif args.command == "bulk-delete":
-        results = ops.bulk_delete(args.tasks)
-        print(f"\nSummary: {len(results['deleted'])} deleted, {len(results['failed'])} failed")
+        results = ops.bulk_delete(task_ids)
+        summary = f"\nSummary: {results['deleted_count']} deleted, {len(results['failed'])} failed"
     
     elif args.command == "export":
         ops.export_to_csv(args.tasklist, args.output)
+    
+    # Let queued per-task warnings reach stderr before the summary line
+    _flush_logging()
+    if summary:
+        print(summary)
+        if results.get("error"):
+            print(f"Error: input stopped early - {results['error']}")
+            sys.exit(1)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the Feishu task scripts
+- One process-wide keep-alive HTTP session, also used by lark-oapi
+- Token-bucket rate limiter
+- Retry policy: rate-limit codes and backoff delay
+- Thread-safe TTL cache
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+
+def shared_session() -> "requests.Session":
+    """Return the process-wide keep-alive session used for all API calls
+    
+    lark-oapi's transport calls `requests.request`, which opens a new
+    connection (and TLS handshake) for every request. Pointing the transport
+    at one pooled session lets every call, SDK or raw, reuse warm
+    connections. The session is built, and the transport patched, once per
+    process however many scripts or clients ask for it. requests is imported
+    here so callers that never make a request don't pay for it.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=64,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            )
+            _session = requests.Session()
+            _session.headers["Connection"] = "keep-alive"
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+            try:
+                from lark_oapi.core.http import transport
+                transport.requests = _session
+            except (ImportError, AttributeError):
+                pass
+        return _session
+
+
+# Feishu error codes that signal request throttling rather than bad input
+RATE_LIMIT_CODES = frozenset({99991400, 99991667})
+
+
+def response_headers(response: Any) -> Dict[str, str]:
+    """Lower-cased HTTP headers of a requests or lark-oapi SDK response"""
+    raw = getattr(response, "raw", None)
+    headers = getattr(raw if raw is not None else response, "headers", None) or {}
+    return {key.lower(): value for key, value in headers.items()}
+
+
+def retry_delay(response: Any, attempt: int) -> float:
+    """Seconds to wait before retry number `attempt` (0-based) of a request
+    
+    Prefers the server's own hint (Retry-After, then the gateway's reset
+    header); otherwise backs off exponentially from 0.5s, capped at 30s,
+    with up to 0.2s of jitter so parallel workers don't retry in lockstep.
+    """
+    headers = response_headers(response)
+    for name in ("retry-after", "x-ogw-ratelimit-reset"):
+        try:
+            return float(headers[name])
+        except (KeyError, TypeError, ValueError):
+            pass
+    return min(30.0, 0.5 * 2 ** attempt) + random.uniform(0, 0.2)
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` calls per `per` seconds
+    
+    The bucket holds at most `burst` tokens (default `rate`) and starts
+    full, so any window of `per` seconds sees at most burst + rate calls.
+    """
+    
+    __slots__ = ("rate", "per", "burst", "_tokens", "_updated", "_lock")
+    
+    def __init__(self, rate: float, per: float = 1.0, burst: Optional[float] = None):
+        self.rate = rate
+        self.per = per
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._updated) * self.rate / self.per
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                time.sleep((1 - self._tokens) * self.per / self.rate)
+    
+    def limit_to(self, rate: float):
+        """Lower the rate, e.g. to a limit advertised by the server"""
+        with self._lock:
+            if 0 < rate < self.rate:
+                self.rate = rate
+                self.burst = max(1.0, min(self.burst, rate))
+                self._tokens = min(self._tokens, self.burst)
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire `ttl` seconds after insertion"""
+    
+    __slots__ = ("maxsize", "ttl", "_data", "_lock")
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[1] < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[0]
+    
+    def set(self, key: Any, value: Any):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[0]
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
@@ -7,30 +7,155 @@ Usage:
     python task_manager.py list --assigned-to-me
     python task_manager.py create --title "New Task" --assignee ou_xxx
     python task_manager.py complete task_xxx
+    python task_manager.py complete --ids task_a task_b task_c
 """
 
 import os
 import sys
 import json
+import io
 import argparse
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Sequence
+
+from feishu_common import (
+    RATE_LIMIT_CODES,
+    RateLimiter,
+    TTLCache,
+    response_headers,
+    retry_delay,
+    shared_session,
+)
 
 try:
     import lark_oapi as lark
-    from lark_oapi.api.task.v2 import *
-    from lark_oapi.api.contact.v3 import *
-    from lark_oapi.api.im.v1 import *
+    from lark_oapi.api.task.v2 import (
+        AddTaskTasklistRequest,
+        AddTaskTasklistRequestBody,
+        CreateTaskRequest,
+        CreateTaskRequestBody,
+        CreateTasklistRequest,
+        CreateTasklistRequestBody,
+        DeleteTaskRequest,
+        DeleteTasklistRequest,
+        GetTaskRequest,
+        GetTasklistRequest,
+        ListTaskRequest,
+        ListTaskTasklistRequest,
+        UpdateTaskRequest,
+        UpdateTaskRequestBody,
+        UpdateTasklistRequest,
+        UpdateTasklistRequestBody,
+    )
 except ImportError:
     print("Error: lark-oapi not installed. Run: pip install lark-oapi")
     sys.exit(1)
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# CLI --due dates are end-of-day in Beijing time
+_DUE_SUFFIX = "T23:59:59+08:00"
+
+
+def _to_due_time(date: Optional[str]) -> Optional[str]:
+    """Expand a YYYY-MM-DD CLI date into a full due timestamp"""
+    return date + _DUE_SUFFIX if date else None
+
+
+def _contact_key(field: str, value: str) -> str:
+    """Normalize an email or mobile so server-echoed identifiers still match
+    
+    Emails compare case-insensitively; mobiles compare on their digits, with
+    a leading +86 country code dropped.
+    """
+    if field == "emails":
+        return value.strip().lower()
+    digits = "".join(ch for ch in value if ch.isdigit())
+    if len(digits) == 13 and digits.startswith("86"):
+        digits = digits[2:]
+    return digits
+
+
+@lru_cache(maxsize=4096)
+def _due_timestamp(value: str) -> float:
+    """Parse an RFC 3339 timestamp into POSIX seconds (naive means UTC)"""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    due = datetime.fromisoformat(value)
+    if due.tzinfo is None:
+        due = due.replace(tzinfo=timezone.utc)
+    return due.timestamp()
+
+
+_ICON_TODO = "📋"
+_ICON_IN_PROGRESS = "🔄"
+_ICON_COMPLETED = "✅"
+_ICON_OVERDUE = "⚠️"
+_ICON_UNKNOWN = "❓"
+
+_STATUS_ICON = {"todo": _ICON_TODO, "in_progress": _ICON_IN_PROGRESS, "completed": _ICON_COMPLETED}
+
+# Extra guidance printed after known API error codes
+_ERROR_HINTS = {
+    99991672: "Check app permissions (task:task:read/write)",
+    99991663: "Task not found, verify task ID",
+}
+
+# Method argument -> task request-body setter
+_TASK_SETTERS = (
+    ("title", "summary"),
+    ("description", "description"),
+    ("status", "status"),
+    ("assignee", "assignee"),
+    ("due_time", "due_time"),
+    ("followers", "followers"),
+    ("parent_task_id", "parent_task_id"),
+)
+
+
+def _build_task_body(builder, **fields):
+    """Apply every non-empty field to a task request-body builder and build it"""
+    for arg, setter in _TASK_SETTERS:
+        value = fields.get(arg)
+        if value:
+            builder = getattr(builder, setter)(value)
+    return builder.build()
+
 
 class FeishuTaskManager:
-    """Manager for Feishu Task operations"""
+    """Manager for Feishu Task operations
+    
+    Instances have no __dict__; subclasses that add attributes must declare
+    their own __slots__.
+    """
     
-    def __init__(self, app_id: Optional[str] = None, app_secret: Optional[str] = None):
-        """Initialize with app credentials (or from env vars)"""
+    __slots__ = (
+        "app_id", "app_secret", "client", "max_workers", "_pool", "_limiter",
+        "_user_cache", "_task_cache", "_tasklist_cache",
+    )
+    
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        app_secret: Optional[str] = None,
+        max_workers: int = 16,
+        rate: float = 50.0
+    ):
+        """Initialize with app credentials (or from env vars)
+        
+        `max_workers` bounds how many requests the bulk helpers (e.g.
+        get_tasks) keep in flight at once; `rate` caps API calls per second
+        across all of them.
+        """
         self.app_id = app_id or os.getenv("FEISHU_APP_ID")
         self.app_secret = app_secret or os.getenv("FEISHU_APP_SECRET")
         
@@ -40,23 +165,102 @@ class FeishuTaskManager:
                 "environment variables or pass to constructor."
             )
         
+        shared_session()
         self.client = lark.Client.builder() \
             .app_id(self.app_id) \
             .app_secret(self.app_secret) \
             .log_level(lark.LogLevel.WARNING) \
             .build()
+        
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._limiter = RateLimiter(rate)
+        self._user_cache = TTLCache(maxsize=1024, ttl=3600)
+        self._task_cache = TTLCache(maxsize=512, ttl=30)
+        self._tasklist_cache = TTLCache(maxsize=128, ttl=30)
+    
+    def _executor(self) -> ThreadPoolExecutor:
+        """Thread pool created on first use and kept for the manager's lifetime"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+    
+    def _fan_out(self, fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """Call fn on every item concurrently, returning results in input order
+        
+        A call that raises (e.g. a connection error) yields None for its item
+        rather than discarding the results of the others.
+        """
+        pool = self._executor()
+        futures = [pool.submit(fn, item) for item in items]
+        results = []
+        for item, future in zip(items, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"Error fetching {item}: {e}", file=sys.stderr)
+                results.append(None)
+        return results
+    
+    def _iter_details(self, tasks: Iterable[Any]) -> Iterator[Any]:
+        """Yield the full record of each listed task, fetched concurrently
+        
+        Records are yielded in completion order; if a fetch fails the listed
+        task is yielded as-is. At most twice `max_workers` fetches are in
+        flight, so `tasks` is consumed lazily rather than all up front.
+        """
+        pool = self._executor()
+        window = 2 * self.max_workers
+        pending: Dict[Any, Any] = {}
+        tasks = iter(tasks)
+        while True:
+            for task in itertools.islice(tasks, window - len(pending)):
+                pending[pool.submit(self.get_task, task.task_id)] = task
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = pending.pop(future)
+                try:
+                    record = future.result()
+                except Exception:
+                    record = None
+                yield record or task
+    
+    def _call(self, send: Callable[[Any], Any], request: Any, max_attempts: int = 5) -> Any:
+        """Send an SDK request under the rate limiter, retrying rate-limit errors
+        
+        Rate-limited responses are retried with exponential backoff and jitter
+        (honouring Retry-After), and a server-advertised limit lowers the
+        limiter. The last response is returned once attempts run out.
+        """
+        for attempt in range(max_attempts):
+            self._limiter.acquire()
+            response = send(request)
+            
+            limit = response_headers(response).get("x-ogw-ratelimit-limit")
+            if limit:
+                try:
+                    self._limiter.limit_to(float(limit))
+                except ValueError:
+                    pass
+            
+            if response.code not in RATE_LIMIT_CODES or attempt == max_attempts - 1:
+                return response
+            time.sleep(retry_delay(response, attempt))
     
     def _handle_response(self, response, operation: str = "Operation") -> Optional[Any]:
         """Handle API response and return data or None on error"""
-        if not response.success():
-            error_msg = f"{operation} failed: {response.code} - {response.msg}"
-            if response.code == 99991672:
-                error_msg += "\nHint: Check app permissions (task:task:read/write)"
-            elif response.code == 99991663:
-                error_msg += "\nHint: Task not found, verify task ID"
-            print(error_msg, file=sys.stderr)
-            return None
-        return response.data
+        if response.success():
+            return response.data
+        
+        hint = _ERROR_HINTS.get(response.code)
+        sys.stderr.write(
+            f"{operation} failed: {response.code} - {response.msg}"
+            + (f"\nHint: {hint}" if hint else "")
+            + "\n"
+        )
+        return None
     
     # ==================== Task CRUD ====================
     
@@ -70,33 +274,40 @@ class FeishuTaskManager:
         parent_task_id: Optional[str] = None
     ) -> Optional[Dict]:
         """Create a new task"""
-        body = CreateTaskRequestBody.builder() \
-            .summary(title) \
-            .description(description)
-        
-        if assignee:
-            body = body.assignee(assignee)
-        if due_time:
-            body = body.due_time(due_time)
-        if followers:
-            body = body.followers(followers)
-        if parent_task_id:
-            body = body.parent_task_id(parent_task_id)
-        
-        request = CreateTaskRequest.builder() \
-            .request_body(body.build()) \
-            .build()
+        body = _build_task_body(
+            CreateTaskRequestBody.builder(),
+            title=title,
+            description=description,
+            assignee=assignee,
+            due_time=due_time,
+            followers=followers,
+            parent_task_id=parent_task_id
+        )
+        request = CreateTaskRequest.builder().request_body(body).build()
         
-        response = self.client.task.v2.task.create(request)
+        response = self._call(self.client.task.v2.task.create, request)
         data = self._handle_response(response, "Create task")
         return data.task if data else None
     
     def get_task(self, task_id: str) -> Optional[Dict]:
-        """Get task details"""
+        """Get task details (cached for 30s; writes through this manager invalidate)"""
+        task = self._task_cache.get(task_id)
+        if task is not None:
+            return task
+        
+        # Built per call: lark rewrites request headers in place on every send,
+        # so a request object shared between threads is not safe to reuse
         request = GetTaskRequest.builder().task_id(task_id).build()
-        response = self.client.task.v2.task.get(request)
+        response = self._call(self.client.task.v2.task.get, request)
         data = self._handle_response(response, "Get task")
-        return data.task if data else None
+        if not data:
+            return None
+        self._task_cache.set(task_id, data.task)
+        return data.task
+    
+    def get_tasks(self, task_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Get details for several tasks concurrently, keyed by task ID"""
+        return dict(zip(task_ids, self._fan_out(self.get_task, task_ids)))
     
     def update_task(
         self,
@@ -108,25 +319,25 @@ class FeishuTaskManager:
         due_time: Optional[str] = None
     ) -> Optional[Dict]:
         """Update task fields"""
-        body = UpdateTaskRequestBody.builder()
-        
-        if title:
-            body = body.summary(title)
-        if description:
-            body = body.description(description)
-        if status:
-            body = body.status(status)
-        if assignee:
-            body = body.assignee(assignee)
-        if due_time:
-            body = body.due_time(due_time)
-        
+        body = _build_task_body(
+            UpdateTaskRequestBody.builder(),
+            title=title,
+            description=description,
+            status=status,
+            assignee=assignee,
+            due_time=due_time
+        )
         request = UpdateTaskRequest.builder() \
             .task_id(task_id) \
-            .request_body(body.build()) \
+            .request_body(body) \
             .build()
         
-        response = self.client.task.v2.task.update(request)
+        # Invalidate after the write so a concurrent get_task cannot re-cache
+        # the old version while the update is in flight
+        try:
+            response = self._call(self.client.task.v2.task.update, request)
+        finally:
+            self._task_cache.pop(task_id)
         data = self._handle_response(response, "Update task")
         return data.task if data else None
     
@@ -135,80 +346,179 @@ class FeishuTaskManager:
         result = self.update_task(task_id, status="completed")
         return result is not None
     
+    def complete_tasks(self, task_ids: List[str]) -> Dict[str, bool]:
+        """Mark several tasks as completed concurrently, keyed by task ID
+        
+        A task whose update raises (e.g. a connection error) is recorded as
+        False rather than aborting the others.
+        """
+        pool = self._executor()
+        futures = {pool.submit(self.complete_task, task_id): task_id for task_id in task_ids}
+        results = {}
+        for future in as_completed(futures):
+            task_id = futures[future]
+            try:
+                results[task_id] = future.result()
+            except Exception as e:
+                print(f"Error completing {task_id}: {e}", file=sys.stderr)
+                results[task_id] = False
+        return results
+    
     def delete_task(self, task_id: str) -> bool:
         """Delete a task"""
         request = DeleteTaskRequest.builder().task_id(task_id).build()
-        response = self.client.task.v2.task.delete(request)
+        try:
+            response = self._call(self.client.task.v2.task.delete, request)
+        finally:
+            self._task_cache.pop(task_id)
         return response.success()
     
+    def clear_task_cache(self):
+        """Forget all cached get_task / get_tasklist results"""
+        self._task_cache.clear()
+        self._tasklist_cache.clear()
+    
     # ==================== Task Queries ====================
     
+    def _paginate(
+        self,
+        build_request: Callable[[Optional[str]], Any],
+        send: Callable[[Any], Any],
+        operation: str
+    ) -> Iterator[Any]:
+        """Yield items from every page of a list endpoint
+        
+        `build_request(page_token)` builds the request for one page and `send`
+        issues it; pages are fetched lazily as the caller iterates.
+        """
+        page_token = None
+        while True:
+            data = self._handle_response(self._call(send, build_request(page_token)), operation)
+            if not data:
+                return
+            yield from data.items or []
+            page_token = data.page_token
+            if not data.has_more or not page_token:
+                return
+    
+    def _iter_tasks(
+        self,
+        *,
+        assigned_to_me: bool = False,
+        created_by_me: bool = False,
+        assignee: Optional[str] = None,
+        statuses: Optional[Sequence[str]] = None,
+        due_before: Optional[str] = None,
+        page_size: int = 50,
+        operation: str = "List tasks"
+    ) -> Iterator[Dict]:
+        """Iterate ListTaskRequest pages for any combination of task filters
+        
+        Generators are independent, so several views can be fetched in
+        parallel, e.g. via `self._fan_out`.
+        """
+        # Converted once here rather than on every page request
+        status_list = list(statuses) if statuses else None
+        
+        def build(page_token):
+            request = ListTaskRequest.builder().page_size(page_size)
+            if assigned_to_me:
+                request = request.assigned_to_me(True)
+            if created_by_me:
+                request = request.created_by_me(True)
+            if assignee:
+                request = request.assignee(assignee)
+            if status_list:
+                request = request.statuses(status_list)
+            if due_before:
+                request = request.due_before(due_before)
+            if page_token:
+                request = request.page_token(page_token)
+            return request.build()
+        
+        return self._paginate(build, self.client.task.v2.task.list, operation)
+    
+    def _list_tasks(self, *, page_size: int = 50, **filters) -> List[Dict]:
+        """First `page_size` tasks matching the `_iter_tasks` filters"""
+        return list(itertools.islice(self._iter_tasks(page_size=page_size, **filters), page_size))
+    
+    def iter_my_tasks(
+        self,
+        statuses: Optional[Sequence[str]] = None,
+        page_size: int = 50
+    ) -> Iterator[Dict]:
+        """Iterate over all tasks assigned to me, page by page"""
+        return self._iter_tasks(
+            assigned_to_me=True, statuses=statuses, page_size=page_size,
+            operation="List my tasks"
+        )
+    
+    def iter_created_by_me(
+        self,
+        statuses: Optional[Sequence[str]] = None,
+        page_size: int = 50
+    ) -> Iterator[Dict]:
+        """Iterate over all tasks created by me, page by page"""
+        return self._iter_tasks(
+            created_by_me=True, statuses=statuses, page_size=page_size,
+            operation="List created tasks"
+        )
+    
+    def iter_tasks_by_assignee(
+        self,
+        assignee: str,
+        statuses: Optional[Sequence[str]] = None,
+        page_size: int = 50
+    ) -> Iterator[Dict]:
+        """Iterate over all tasks of a specific assignee, page by page"""
+        return self._iter_tasks(
+            assignee=assignee, statuses=statuses, page_size=page_size,
+            operation="List tasks by assignee"
+        )
+    
     def list_my_tasks(
         self,
-        statuses: Optional[List[str]] = None,
+        statuses: Optional[Sequence[str]] = None,
         page_size: int = 50
     ) -> List[Dict]:
-        """List tasks assigned to me"""
-        request = ListTaskRequest.builder() \
-            .assigned_to_me(True) \
-            .page_size(page_size)
-        
-        if statuses:
-            request = request.statuses(statuses)
-        
-        response = self.client.task.v2.task.list(request.build())
-        data = self._handle_response(response, "List my tasks")
-        return data.items if data else []
+        """List tasks assigned to me (first `page_size` tasks)"""
+        return self._list_tasks(
+            assigned_to_me=True, statuses=statuses, page_size=page_size,
+            operation="List my tasks"
+        )
     
     def list_created_by_me(
         self,
-        statuses: Optional[List[str]] = None,
+        statuses: Optional[Sequence[str]] = None,
         page_size: int = 50
     ) -> List[Dict]:
-        """List tasks created by me"""
-        request = ListTaskRequest.builder() \
-            .created_by_me(True) \
-            .page_size(page_size)
-        
-        if statuses:
-            request = request.statuses(statuses)
-        
-        response = self.client.task.v2.task.list(request.build())
-        data = self._handle_response(response, "List created tasks")
-        return data.items if data else []
+        """List tasks created by me (first `page_size` tasks)"""
+        return self._list_tasks(
+            created_by_me=True, statuses=statuses, page_size=page_size,
+            operation="List created tasks"
+        )
     
     def list_tasks_by_assignee(
         self,
         assignee: str,
-        statuses: Optional[List[str]] = None,
+        statuses: Optional[Sequence[str]] = None,
         page_size: int = 50
     ) -> List[Dict]:
-        """List tasks by specific assignee"""
-        request = ListTaskRequest.builder() \
-            .assignee(assignee) \
-            .page_size(page_size)
-        
-        if statuses:
-            request = request.statuses(statuses)
-        
-        response = self.client.task.v2.task.list(request.build())
-        data = self._handle_response(response, "List tasks by assignee")
-        return data.items if data else []
+        """List tasks by specific assignee (first `page_size` tasks)"""
+        return self._list_tasks(
+            assignee=assignee, statuses=statuses, page_size=page_size,
+            operation="List tasks by assignee"
+        )
     
     def get_tasks_due_soon(self, days: int = 3) -> List[Dict]:
         """Get tasks due within specified days"""
-        due_before = (datetime.now() + timedelta(days=days)).isoformat()
-        
-        request = ListTaskRequest.builder() \
-            .assigned_to_me(True) \
-            .due_before(due_before) \
-            .statuses(["todo", "in_progress"]) \
-            .page_size(100) \
-            .build()
-        
-        response = self.client.task.v2.task.list(request)
-        data = self._handle_response(response, "List tasks due soon")
-        return data.items if data else []
+        return self._list_tasks(
+            assigned_to_me=True,
+            statuses=["todo", "in_progress"],
+            due_before=(datetime.now() + timedelta(days=days)).isoformat(),
+            page_size=100,
+            operation="List tasks due soon"
+        )
     
     # ==================== Tasklist Operations ====================
     
@@ -223,16 +533,23 @@ class FeishuTaskManager:
             ) \
             .build()
         
-        response = self.client.task.v2.tasklist.create(request)
+        response = self._call(self.client.task.v2.tasklist.create, request)
         data = self._handle_response(response, "Create tasklist")
         return data.tasklist if data else None
     
     def get_tasklist(self, tasklist_id: str) -> Optional[Dict]:
-        """Get tasklist details"""
+        """Get tasklist details (cached for 30s; writes through this manager invalidate)"""
+        tasklist = self._tasklist_cache.get(tasklist_id)
+        if tasklist is not None:
+            return tasklist
+        
         request = GetTasklistRequest.builder().tasklist_id(tasklist_id).build()
-        response = self.client.task.v2.tasklist.get(request)
+        response = self._call(self.client.task.v2.tasklist.get, request)
         data = self._handle_response(response, "Get tasklist")
-        return data.tasklist if data else None
+        if not data:
+            return None
+        self._tasklist_cache.set(tasklist_id, data.tasklist)
+        return data.tasklist
     
     def update_tasklist(
         self,
@@ -252,31 +569,50 @@ class FeishuTaskManager:
             .request_body(body.build()) \
             .build()
         
-        response = self.client.task.v2.tasklist.update(request)
+        try:
+            response = self._call(self.client.task.v2.tasklist.update, request)
+        finally:
+            self._tasklist_cache.pop(tasklist_id)
         data = self._handle_response(response, "Update tasklist")
         return data.tasklist if data else None
     
     def delete_tasklist(self, tasklist_id: str) -> bool:
         """Delete a tasklist"""
         request = DeleteTasklistRequest.builder().tasklist_id(tasklist_id).build()
-        response = self.client.task.v2.tasklist.delete(request)
+        try:
+            response = self._call(self.client.task.v2.tasklist.delete, request)
+        finally:
+            self._tasklist_cache.pop(tasklist_id)
         return response.success()
     
-    def list_tasklists(self, page_size: int = 50) -> List[Dict]:
-        """List all tasklists"""
+    def iter_tasklists(self, page_size: int = 50) -> Iterator[Dict]:
+        """Iterate over all tasklists, page by page"""
         # Note: SDK may not expose list tasklists directly, use raw API
-        request = lark.BaseRequest.builder() \
-            .http_method(lark.HttpMethod.GET) \
-            .uri("/open-apis/task/v2/tasklists") \
-            .token_types({lark.AccessTokenType.TENANT}) \
-            .queries([("page_size", str(page_size))]) \
-            .build()
-        
-        response = self.client.request(request)
-        if response.success():
-            result = json.loads(str(response.raw.content, lark.UTF_8))
-            return result.get("data", {}).get("items", [])
-        return []
+        page_token = None
+        while True:
+            queries = [("page_size", str(page_size))]
+            if page_token:
+                queries.append(("page_token", page_token))
+            request = lark.BaseRequest.builder() \
+                .http_method(lark.HttpMethod.GET) \
+                .uri("/open-apis/task/v2/tasklists") \
+                .token_types({lark.AccessTokenType.TENANT}) \
+                .queries(queries) \
+                .build()
+            
+            response = self._call(self.client.request, request)
+            if not response.success():
+                return
+            # Parse the raw bytes directly rather than decoding to str first
+            data = _loads(response.raw.content).get("data", {})
+            yield from data.get("items", [])
+            page_token = data.get("page_token")
+            if not data.get("has_more") or not page_token:
+                return
+    
+    def list_tasklists(self, page_size: int = 50) -> List[Dict]:
+        """List tasklists (first `page_size` tasklists)"""
+        return list(itertools.islice(self.iter_tasklists(page_size), page_size))
     
     def add_task_to_tasklist(self, tasklist_id: str, task_id: str) -> bool:
         """Add task to tasklist"""
@@ -289,137 +625,203 @@ class FeishuTaskManager:
             ) \
             .build()
         
-        response = self.client.task.v2.tasklist.add_task(request)
+        try:
+            response = self._call(self.client.task.v2.tasklist.add_task, request)
+        finally:
+            self._task_cache.pop(task_id)
         return response.success()
     
+    def iter_tasks_in_tasklist(
+        self,
+        tasklist_id: str,
+        page_size: int = 100
+    ) -> Iterator[Dict]:
+        """Iterate over all tasks in a tasklist, page by page"""
+        def build(page_token):
+            request = ListTaskTasklistRequest.builder() \
+                .tasklist_id(tasklist_id) \
+                .page_size(page_size)
+            if page_token:
+                request = request.page_token(page_token)
+            return request.build()
+        
+        return self._paginate(
+            build, self.client.task.v2.tasklist.list_task, "List tasks in tasklist"
+        )
+    
     def list_tasks_in_tasklist(
         self,
         tasklist_id: str,
         page_size: int = 100
     ) -> List[Dict]:
-        """List all tasks in a tasklist"""
-        request = ListTaskTasklistRequest.builder() \
-            .tasklist_id(tasklist_id) \
-            .page_size(page_size) \
-            .build()
-        
-        response = self.client.task.v2.tasklist.list_task(request)
-        data = self._handle_response(response, "List tasks in tasklist")
-        return data.items if data else []
+        """List tasks in a tasklist (first `page_size` tasks)"""
+        return list(itertools.islice(
+            self.iter_tasks_in_tasklist(tasklist_id, page_size), page_size
+        ))
     
     # ==================== User Lookup ====================
     
+    def _batch_get_user_ids(self, field: str, values: List[str]) -> Dict[str, str]:
+        """Resolve emails or mobiles to open_ids, 50 identifiers per request
+        
+        `field` is "emails" or "mobiles". Results are keyed by the identifiers
+        as passed in, matched to the API's echoed ones after normalization
+        (see _contact_key). Identifiers without a matching user are omitted.
+        Resolved identifiers are cached for an hour, so only cache misses are
+        sent to the API.
+        """
+        key = "email" if field == "emails" else "mobile"
+        found: Dict[str, str] = {}
+        missing: List[str] = []
+        
+        for value in values:
+            user_id = self._user_cache.get((field, value))
+            if user_id is None:
+                missing.append(value)
+            else:
+                found[value] = user_id
+        
+        if not missing:
+            return found
+        
+        # contact.v3 is only needed for lookups that miss the cache
+        from lark_oapi.api.contact.v3 import BatchGetIdUserRequest, BatchGetIdUserRequestBody
+        
+        for start in range(0, len(missing), 50):
+            chunk = missing[start:start + 50]
+            body = BatchGetIdUserRequestBody.builder()
+            body = getattr(body, field)(chunk)
+            request = BatchGetIdUserRequest.builder() \
+                .user_id_type("open_id") \
+                .request_body(body.build()) \
+                .build()
+            
+            response = self._call(self.client.contact.v3.user.batch_get_id, request)
+            if response.success() and response.data:
+                users = response.data.user_list or []
+                requested = {_contact_key(field, value): value for value in chunk}
+                for user in users:
+                    if not user.user_id:
+                        continue
+                    value = requested.get(_contact_key(field, getattr(user, key) or ""))
+                    if value is None and len(chunk) == 1 and len(users) == 1:
+                        # A single lookup can only have answered the one identifier
+                        value = chunk[0]
+                    if value is not None:
+                        found[value] = user.user_id
+                        self._user_cache.set((field, value), user.user_id)
+        
+        return found
+    
+    def clear_user_cache(self):
+        """Forget all cached email/phone -> open_id lookups"""
+        self._user_cache.clear()
+    
+    def get_users_by_emails(self, emails: List[str]) -> Dict[str, str]:
+        """Get user open_ids for several emails, keyed by email"""
+        return self._batch_get_user_ids("emails", emails)
+    
+    def get_users_by_phones(self, phones: List[str]) -> Dict[str, str]:
+        """Get user open_ids for several phone numbers, keyed by phone"""
+        return self._batch_get_user_ids("mobiles", phones)
+    
     def get_user_by_email(self, email: str) -> Optional[str]:
         """Get user open_id by email"""
-        request = BatchGetIdUserRequest.builder() \
-            .user_id_type("open_id") \
-            .request_body(
-                BatchGetIdUserRequestBody.builder()
-                .emails([email])
-                .build()
-            ) \
-            .build()
-        
-        response = self.client.contact.v3.user.batch_get_id(request)
-        if response.success() and response.data:
-            users = response.data.user_list
-            if users:
-                return users[0].user_id
-        return None
+        return self.get_users_by_emails([email]).get(email)
     
     def get_user_by_phone(self, phone: str) -> Optional[str]:
         """Get user open_id by phone"""
-        request = BatchGetIdUserRequest.builder() \
-            .user_id_type("open_id") \
-            .request_body(
-                BatchGetIdUserRequestBody.builder()
-                .mobiles([phone])
-                .build()
-            ) \
-            .build()
-        
-        response = self.client.contact.v3.user.batch_get_id(request)
-        if response.success() and response.data:
-            users = response.data.user_list
-            if users:
-                return users[0].user_id
-        return None
+        return self.get_users_by_phones([phone]).get(phone)
     
     # ==================== Reporting ====================
     
-    def generate_task_report(self, tasklist_id: Optional[str] = None) -> Dict:
-        """Generate task status report"""
+    def generate_task_report(
+        self,
+        tasklist_id: Optional[str] = None,
+        with_details: bool = False
+    ) -> Dict:
+        """Generate task status report over every page of tasks
+        
+        With `with_details`, each listed task is replaced by its full record
+        from get_task, fetched concurrently on the manager's thread pool.
+        """
         if tasklist_id:
-            tasks = self.list_tasks_in_tasklist(tasklist_id)
+            tasks = self.iter_tasks_in_tasklist(tasklist_id)
         else:
-            tasks = self.list_my_tasks(page_size=100)
-        
-        report = {
-            "total": len(tasks),
-            "todo": [],
-            "in_progress": [],
-            "completed": [],
-            "overdue": []
-        }
+            tasks = self.iter_my_tasks(page_size=100)
         
-        now = datetime.now()
+        if with_details:
+            tasks = self._iter_details(tasks)
+        
+        todo, in_progress, completed, overdue = [], [], [], []
+        buckets = {"todo": todo, "in_progress": in_progress, "completed": completed}
+        now_ts = datetime.now(timezone.utc).timestamp()
+        total = 0
         
         for task in tasks:
-            status = task.status
-            if status in report:
-                report[status].append(task)
+            total += 1
+            bucket = buckets.get(task.status)
+            if bucket is None:
+                continue
+            bucket.append(task)
             
-            # Check overdue
-            if task.due_time and status in ["todo", "in_progress"]:
-                due = datetime.fromisoformat(task.due_time.replace("Z", "+00:00"))
-                if due < now:
-                    report["overdue"].append(task)
-        
-        return report
+            # Check overdue (only open tasks need their due time parsed)
+            if bucket is not completed and task.due_time and _due_timestamp(task.due_time) < now_ts:
+                overdue.append(task)
+        
+        return {
+            "total": total,
+            "todo": todo,
+            "in_progress": in_progress,
+            "completed": completed,
+            "overdue": overdue
+        }
     
     def print_report(self, report: Dict):
-        """Print formatted task report"""
-        print(f"\n{'='*50}")
-        print(f"Task Report - Total: {report['total']}")
-        print(f"{'='*50}")
-        print(f"📋 Todo: {len(report['todo'])}")
-        print(f"🔄 In Progress: {len(report['in_progress'])}")
-        print(f"✅ Completed: {len(report['completed'])}")
-        print(f"⚠️  Overdue: {len(report['overdue'])}")
+        """Print formatted task report (written to stdout in one call)"""
+        buf = io.StringIO()
+        buf.write(f"\n{'='*50}\n")
+        buf.write(f"Task Report - Total: {report['total']}\n")
+        buf.write(f"{'='*50}\n")
+        buf.write(f"{_ICON_TODO} Todo: {len(report['todo'])}\n")
+        buf.write(f"{_ICON_IN_PROGRESS} In Progress: {len(report['in_progress'])}\n")
+        buf.write(f"{_ICON_COMPLETED} Completed: {len(report['completed'])}\n")
+        buf.write(f"{_ICON_OVERDUE}  Overdue: {len(report['overdue'])}\n")
         
         if report['overdue']:
-            print(f"\n⚠️  Overdue Tasks:")
+            buf.write(f"\n{_ICON_OVERDUE}  Overdue Tasks:\n")
             for task in report['overdue']:
-                print(f"  - {task.summary} (Due: {task.due_time})")
+                buf.write(f"  - {task.summary} (Due: {task.due_time})\n")
+        
+        sys.stdout.write(buf.getvalue())
 
 
 # ==================== CLI Interface ====================
 
-def main():
-    parser = argparse.ArgumentParser(description="Feishu Task Manager")
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-    
-    # List command
+def _add_list_parser(subparsers):
     list_parser = subparsers.add_parser("list", help="List tasks")
     list_parser.add_argument("--assigned-to-me", action="store_true", help="Tasks assigned to me")
     list_parser.add_argument("--created-by-me", action="store_true", help="Tasks created by me")
     list_parser.add_argument("--assignee", help="Filter by assignee open_id")
     list_parser.add_argument("--status", choices=["todo", "in_progress", "completed"], action="append")
     list_parser.add_argument("--due-soon", type=int, metavar="DAYS", help="Tasks due within N days")
-    
-    # Create command
+
+
+def _add_create_parser(subparsers):
     create_parser = subparsers.add_parser("create", help="Create a task")
     create_parser.add_argument("--title", required=True, help="Task title")
     create_parser.add_argument("--description", default="", help="Task description")
     create_parser.add_argument("--assignee", help="Assignee open_id")
     create_parser.add_argument("--due", help="Due date (YYYY-MM-DD)")
     create_parser.add_argument("--followers", nargs="+", help="Follower open_ids")
-    
-    # Get command
+
+
+def _add_get_parser(subparsers):
     get_parser = subparsers.add_parser("get", help="Get task details")
-    get_parser.add_argument("task_id", help="Task ID")
-    
-    # Update command
+    get_parser.add_argument("task_ids", nargs="+", metavar="task_id", help="Task ID(s)")
+
+
+def _add_update_parser(subparsers):
     update_parser = subparsers.add_parser("update", help="Update a task")
     update_parser.add_argument("task_id", help="Task ID")
     update_parser.add_argument("--title", help="New title")
@@ -427,16 +829,21 @@ def main():
     update_parser.add_argument("--status", choices=["todo", "in_progress", "completed"])
     update_parser.add_argument("--assignee", help="New assignee")
     update_parser.add_argument("--due", help="New due date (YYYY-MM-DD)")
-    
-    # Complete command
-    complete_parser = subparsers.add_parser("complete", help="Mark task as completed")
-    complete_parser.add_argument("task_id", help="Task ID")
-    
-    # Delete command
+
+
+def _add_complete_parser(subparsers):
+    complete_parser = subparsers.add_parser("complete", help="Mark task(s) as completed")
+    target = complete_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("task_id", nargs="?", help="Task ID")
+    target.add_argument("--ids", nargs="+", metavar="TASK_ID", help="Complete several tasks concurrently")
+
+
+def _add_delete_parser(subparsers):
     delete_parser = subparsers.add_parser("delete", help="Delete a task")
     delete_parser.add_argument("task_id", help="Task ID")
-    
-    # Tasklist commands
+
+
+def _add_tasklist_parser(subparsers):
     tasklist_parser = subparsers.add_parser("tasklist", help="Tasklist operations")
     tasklist_subparsers = tasklist_parser.add_subparsers(dest="tasklist_cmd")
     
@@ -453,11 +860,47 @@ def main():
     tl_add = tasklist_subparsers.add_parser("add-task", help="Add task to tasklist")
     tl_add.add_argument("tasklist_id", help="Tasklist ID")
     tl_add.add_argument("task_id", help="Task ID")
-    
-    # Report command
+
+
+def _add_report_parser(subparsers):
     report_parser = subparsers.add_parser("report", help="Generate task report")
     report_parser.add_argument("--tasklist", help="Tasklist ID (optional)")
+    report_parser.add_argument("--details", action="store_true", help="Fetch full details for each task")
+
+
+_COMMAND_PARSERS = {
+    "list": _add_list_parser,
+    "create": _add_create_parser,
+    "get": _add_get_parser,
+    "update": _add_update_parser,
+    "complete": _add_complete_parser,
+    "delete": _add_delete_parser,
+    "tasklist": _add_tasklist_parser,
+    "report": _add_report_parser,
+}
+
+
+def _build_parser(argv: List[str]) -> argparse.ArgumentParser:
+    """Build the CLI parser, registering only the invoked subcommand when known
+    
+    Help and unknown commands still get the full command tree.
+    """
+    parser = argparse.ArgumentParser(description="Feishu Task Manager")
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
     
+    add_command = _COMMAND_PARSERS.get(argv[0]) if argv else None
+    for add in ([add_command] if add_command else _COMMAND_PARSERS.values()):
+        add(subparsers)
+    return parser
+
+
+def main():
+    # Emit UTF-8 regardless of the console code page so the icons never
+    # fall back to per-character escaping (e.g. cp1252 on Windows)
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8")
+    
+    parser = _build_parser(sys.argv[1:])
     args = parser.parse_args()
     
     if not args.command:
@@ -473,93 +916,95 @@ def main():
     
     # Execute command
     if args.command == "list":
+        statuses = tuple(map(sys.intern, args.status)) if args.status else None
         if args.due_soon:
             tasks = manager.get_tasks_due_soon(args.due_soon)
         elif args.created_by_me:
-            tasks = manager.list_created_by_me(statuses=args.status)
+            tasks = manager.list_created_by_me(statuses=statuses)
         elif args.assignee:
-            tasks = manager.list_tasks_by_assignee(args.assignee, statuses=args.status)
+            tasks = manager.list_tasks_by_assignee(args.assignee, statuses=statuses)
         else:
-            tasks = manager.list_my_tasks(statuses=args.status)
+            tasks = manager.list_my_tasks(statuses=statuses)
         
-        print(f"\nFound {len(tasks)} tasks:")
+        lines = [f"\nFound {len(tasks)} tasks:"]
         for task in tasks:
-            status_icon = {"todo": "📋", "in_progress": "🔄", "completed": "✅"}.get(task.status, "❓")
+            status_icon = _STATUS_ICON.get(task.status, _ICON_UNKNOWN)
             due = f" (Due: {task.due_time[:10]})" if task.due_time else ""
-            print(f"  {status_icon} [{task.task_id}] {task.summary}{due}")
+            lines.append(f"  {status_icon} [{task.task_id}] {task.summary}{due}")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     elif args.command == "create":
-        due_time = None
-        if args.due:
-            due_time = f"{args.due}T23:59:59+08:00"
-        
         task = manager.create_task(
             title=args.title,
             description=args.description,
             assignee=args.assignee,
-            due_time=due_time,
+            due_time=_to_due_time(args.due),
             followers=args.followers
         )
         if task:
-            print(f"✅ Task created: {task.task_id}")
+            print(f"{_ICON_COMPLETED} Task created: {task.task_id}")
             print(f"   URL: {task.url}")
     
     elif args.command == "get":
-        task = manager.get_task(args.task_id)
-        if task:
-            print(f"\nTask: {task.summary}")
-            print(f"ID: {task.task_id}")
-            print(f"Status: {task.status}")
-            print(f"Assignee: {task.assignee}")
-            if task.due_time:
-                print(f"Due: {task.due_time}")
-            if task.description:
-                print(f"Description: {task.description}")
-            print(f"URL: {task.url}")
+        for task in manager.get_tasks(args.task_ids).values():
+            if task:
+                print(f"\nTask: {task.summary}")
+                print(f"ID: {task.task_id}")
+                print(f"Status: {task.status}")
+                print(f"Assignee: {task.assignee}")
+                if task.due_time:
+                    print(f"Due: {task.due_time}")
+                if task.description:
+                    print(f"Description: {task.description}")
+                print(f"URL: {task.url}")
     
     elif args.command == "update":
-        due_time = None
-        if args.due:
-            due_time = f"{args.due}T23:59:59+08:00"
-        
         task = manager.update_task(
             task_id=args.task_id,
             title=args.title,
             description=args.description,
             status=args.status,
             assignee=args.assignee,
-            due_time=due_time
+            due_time=_to_due_time(args.due)
         )
         if task:
-            print(f"✅ Task updated: {task.task_id}")
+            print(f"{_ICON_COMPLETED} Task updated: {task.task_id}")
     
     elif args.command == "complete":
-        if manager.complete_task(args.task_id):
-            print(f"✅ Task {args.task_id} marked as completed")
+        if args.ids:
+            results = manager.complete_tasks(args.ids)
+            done = sum(results.values())
+            print(f"{_ICON_COMPLETED} {done}/{len(results)} tasks marked as completed")
+            failed = [task_id for task_id, ok in results.items() if not ok]
+            if failed:
+                print(f"Failed: {', '.join(failed)}", file=sys.stderr)
+        elif manager.complete_task(args.task_id):
+            print(f"{_ICON_COMPLETED} Task {args.task_id} marked as completed")
     
     elif args.command == "delete":
         if manager.delete_task(args.task_id):
-            print(f"✅ Task {args.task_id} deleted")
+            print(f"{_ICON_COMPLETED} Task {args.task_id} deleted")
     
     elif args.command == "tasklist":
         if args.tasklist_cmd == "create":
             tasklist = manager.create_tasklist(args.name, args.description)
             if tasklist:
-                print(f"✅ Tasklist created: {tasklist.tasklist_id}")
+                print(f"{_ICON_COMPLETED} Tasklist created: {tasklist.tasklist_id}")
         
         elif args.tasklist_cmd == "list-tasks":
             tasks = manager.list_tasks_in_tasklist(args.tasklist_id)
-            print(f"\nFound {len(tasks)} tasks in tasklist:")
+            lines = [f"\nFound {len(tasks)} tasks in tasklist:"]
             for task in tasks:
-                status_icon = {"todo": "📋", "in_progress": "🔄", "completed": "✅"}.get(task.status, "❓")
-                print(f"  {status_icon} [{task.task_id}] {task.summary}")
+                status_icon = _STATUS_ICON.get(task.status, _ICON_UNKNOWN)
+                lines.append(f"  {status_icon} [{task.task_id}] {task.summary}")
+            sys.stdout.write("\n".join(lines) + "\n")
         
         elif args.tasklist_cmd == "add-task":
             if manager.add_task_to_tasklist(args.tasklist_id, args.task_id):
-                print(f"✅ Task added to tasklist")
+                print(f"{_ICON_COMPLETED} Task added to tasklist")
     
     elif args.command == "report":
-        report = manager.generate_task_report(args.tasklist)
+        report = manager.generate_task_report(args.tasklist, with_details=args.details)
         manager.print_report(report)
 
 
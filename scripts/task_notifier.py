@@ -9,61 +9,296 @@ Task notification utilities for Feishu
 import os
 import sys
 import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import hashlib
+import heapq
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, List, Dict, Iterator, Optional, Union
+
+from feishu_common import RATE_LIMIT_CODES, RateLimiter, TTLCache, retry_delay, shared_session
+
+# lark-oapi (and its requests transport) is imported on first use, so
+# --help and argument errors don't pay its import cost; request builders
+# are imported inside the methods that use them
+lark: Any = None
+_LARK_READY = False
+
+
+def _load_lark():
+    """Import lark-oapi once, exiting with a hint if it is missing"""
+    global lark, _LARK_READY
+    if not _LARK_READY:
+        try:
+            import lark_oapi
+        except ImportError:
+            print("Error: lark-oapi not installed")
+            sys.exit(1)
+        lark = lark_oapi
+        _LARK_READY = True
+
 
 try:
-    import lark_oapi as lark
-    from lark_oapi.api.task.v2 import *
-    from lark_oapi.api.im.v1 import *
+    import orjson
+    
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
 except ImportError:
-    print("Error: lark-oapi not installed")
-    sys.exit(1)
+    def _dumps(obj) -> str:
+        # Same compact, non-escaped output as orjson
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# Per-user state (digest hashes, digest schedule) persisted between runs
+_CACHE_DIR = Path.home() / ".cache" / "feishu-task-skill"
+
+# Adaptive digest schedule: the base interval shrinks as 1 / (1 + ema / K),
+# where ema is a moving average of tasks changed between digests
+_DIGEST_INTERVALS = {"daily": 24 * 3600, "weekly": 7 * 24 * 3600}
+_SCHEDULE_K = 10
+_SCHEDULE_ALPHA = 0.5
+# Tolerance for cron jitter, so a run slightly early still counts as due
+_SCHEDULE_SLACK = 3600
+
+_OPEN_ID_RE = re.compile(r"^ou_[A-Za-z0-9_-]{10,64}$")
+_TASK_ID_RE = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+
+
+def _check_open_id(value: str) -> str:
+    """Reject malformed open_ids before they cost an API round-trip"""
+    if not value or not _OPEN_ID_RE.match(value):
+        raise ValueError(f"Invalid open_id: {value!r}")
+    return value
+
+
+def _check_task_id(value: str) -> str:
+    """Reject malformed task IDs before they cost an API round-trip"""
+    if not value or not _TASK_ID_RE.match(value):
+        raise ValueError(f"Invalid task ID: {value!r}")
+    return value
+
+
+_STATUS_TEXT = MappingProxyType({
+    "todo": "📋 待处理",
+    "in_progress": "🔄 进行中",
+    "completed": "✅ 已完成"
+})
+
+# Completion notices for tasks with at least this many followers go to the
+# followers' group chat (found by name, used only if they are all members)
+# instead of one DM per follower
+_FOLLOWERS_CHAT_NAME = os.getenv("FEISHU_FOLLOWERS_CHAT", "task-followers")
+_GROUP_NOTIFY_MIN_FOLLOWERS = 3
+
+# Flow-control / transient error codes worth retrying a message send on,
+# on top of the shared rate-limit codes
+_RETRYABLE = RATE_LIMIT_CODES | {2200, 11232, 429, 99991663}
+
+
+def _env_rps(default: float = 5.0) -> float:
+    """FEISHU_RPS as a positive float, falling back to `default` if malformed"""
+    raw = os.getenv("FEISHU_RPS")
+    if raw is None:
+        return default
+    try:
+        rps = float(raw)
+    except ValueError:
+        rps = 0.0
+    if not rps > 0 or rps == float("inf"):
+        print(f"Warning: ignoring invalid FEISHU_RPS={raw!r}, using {default:g}", file=sys.stderr)
+        return default
+    return rps
+
+
+# Process-wide send budget, shared by every notifier
+_send_bucket = RateLimiter(_env_rps())
+
+
+def _read_state(name: str) -> Dict:
+    """Load a JSON state file from the cache dir ({} if missing or corrupt)"""
+    try:
+        with open(_CACHE_DIR / name, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_state(name: str, data: Dict):
+    """Write a JSON state file to the cache dir, replacing it atomically"""
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = _CACHE_DIR / name
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an RFC 3339 timestamp into an aware datetime (naive means UTC)"""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
 
 
 class TaskNotifier:
     """Send notifications about tasks via Feishu IM"""
     
-    def __init__(self, app_id: Optional[str] = None, app_secret: Optional[str] = None):
+    # One lark client per app, shared by every notifier in the process
+    _clients: Dict[tuple, "lark.Client"] = {}
+    _clients_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        app_secret: Optional[str] = None,
+        max_workers: int = 10
+    ):
+        """Initialize with app credentials (or from env vars)
+        
+        `max_workers` bounds how many messages are sent at once when one
+        notification goes to several recipients.
+        """
         self.app_id = app_id or os.getenv("FEISHU_APP_ID")
         self.app_secret = app_secret or os.getenv("FEISHU_APP_SECRET")
         
         if not self.app_id or not self.app_secret:
             raise ValueError("App credentials required")
         
-        self.client = lark.Client.builder() \
-            .app_id(self.app_id) \
-            .app_secret(self.app_secret) \
-            .log_level(lark.LogLevel.WARNING) \
-            .build()
+        self.client = self._get_client(self.app_id, self.app_secret)
+        
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._task_cache = TTLCache(maxsize=512, ttl=30)
+        self._card_cache = TTLCache(maxsize=2048, ttl=300)
+        # Stay under Feishu's 100 messages/minute cap with some headroom: a
+        # burst of 5 plus 85/min refill caps any 60s window at 90 sends
+        self._limiter = RateLimiter(rate=85, per=60, burst=5)
+        self._hashes: Optional[Dict[str, str]] = None
+        self._schedule: Optional[Dict[str, Dict]] = None
+        # Followers chat id ("" when absent) and its member open_ids
+        self._chat_cache = TTLCache(maxsize=64, ttl=300)
+    
+    @classmethod
+    def _get_client(cls, app_id: str, app_secret: str) -> "lark.Client":
+        """Return the shared lark client for this app, building it once"""
+        key = (app_id, app_secret)
+        with cls._clients_lock:
+            client = cls._clients.get(key)
+            if client is None:
+                _load_lark()
+                shared_session()
+                client = lark.Client.builder() \
+                    .app_id(app_id) \
+                    .app_secret(app_secret) \
+                    .log_level(lark.LogLevel.WARNING) \
+                    .build()
+                cls._clients[key] = client
+            return client
+    
+    def _executor(self) -> ThreadPoolExecutor:
+        """Thread pool created on first use and kept for the notifier's lifetime"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+    
+    def _get_task(self, task_id: str):
+        """Fetch a task, reusing results from the last 30 seconds"""
+        task = self._task_cache.get(task_id)
+        if task is not None:
+            return task
+        
+        from lark_oapi.api.task.v2 import GetTaskRequest
+        
+        request = GetTaskRequest.builder().task_id(task_id).build()
+        response = self.client.task.v2.task.get(request)
+        if response.code != 0:
+            return None
+        
+        self._task_cache.set(task_id, response.data.task)
+        return response.data.task
     
-    def _send_message(self, receive_id: str, content: Dict, msg_type: str = "interactive") -> bool:
-        """Send message to user"""
+    def _iter_all(self, new_builder, send=None) -> Iterator[Any]:
+        """Lazily yield the items of every page of a list endpoint
+        
+        `new_builder()` returns a request builder with the filters applied;
+        `send` defaults to the task list endpoint. Pages are fetched only as
+        the caller iterates, so stopping early skips the remaining pages.
+        Raises RuntimeError if a page fails.
+        """
+        send = send or self.client.task.v2.task.list
+        page_token = None
+        while True:
+            builder = new_builder()
+            if page_token:
+                builder = builder.page_token(page_token)
+            response = send(builder.build())
+            if response.code != 0:
+                raise RuntimeError(response.msg)
+            yield from response.data.items or []
+            page_token = response.data.page_token
+            if not response.data.has_more or not page_token:
+                return
+    
+    def _list_all(self, new_builder, send=None) -> Optional[List]:
+        """Collect every item `_iter_all` yields; None if any page fails"""
+        try:
+            return list(self._iter_all(new_builder, send))
+        except RuntimeError as e:
+            print(f"Error fetching list: {e}")
+            return None
+    
+    def _send_message(
+        self,
+        receive_id: str,
+        content: Union[Dict, str],
+        msg_type: str = "interactive",
+        max_retries: int = 5,
+        receive_id_type: str = "open_id"
+    ) -> bool:
+        """Send message to a user (or a chat, with receive_id_type="chat_id")
+        
+        `content` may already be serialized JSON, so one payload can be sent
+        to many recipients without re-encoding it. Flow-control errors are
+        retried with exponential backoff (or the server's Retry-After) up to
+        `max_retries` times.
+        """
+        from lark_oapi.api.im.v1 import CreateMessageRequest, CreateMessageRequestBody
+        
         try:
             request = CreateMessageRequest.builder() \
-                .receive_id_type("open_id") \
+                .receive_id_type(receive_id_type) \
                 .request_body(
                     CreateMessageRequestBody.builder()
                     .receive_id(receive_id)
                     .msg_type(msg_type)
-                    .content(json.dumps(content))
+                    .content(content if isinstance(content, str) else _dumps(content))
                     .build()
                 ) \
                 .build()
             
-            response = self.client.im.v1.message.create(request)
-            return response.success()
+            for attempt in range(max_retries + 1):
+                self._limiter.acquire()
+                _send_bucket.acquire()
+                response = self.client.im.v1.message.create(request)
+                if response.code == 0:
+                    return True
+                status = getattr(response.raw, "status_code", None)
+                if attempt == max_retries or (response.code not in _RETRYABLE and status != 429):
+                    print(f"Failed to send message: {response.code} - {response.msg}")
+                    return False
+                time.sleep(retry_delay(response, attempt))
         except Exception as e:
             print(f"Failed to send message: {e}")
             return False
     
     def _build_task_card(self, task, title: str, color: str = "blue") -> Dict:
         """Build interactive card for task"""
-        status_text = {
-            "todo": "📋 待处理",
-            "in_progress": "🔄 进行中",
-            "completed": "✅ 已完成"
-        }.get(task.status, task.status)
+        status_text = _STATUS_TEXT.get(task.status, task.status)
         
         due_text = f"\n**截止时间**: {task.due_time[:10]}" if task.due_time else ""
         
@@ -95,28 +330,115 @@ class TaskNotifier:
             ]
         }
     
+    def _task_card_json(self, task, title: str, color: str = "blue") -> str:
+        """Serialized task card, reused while the task's visible fields are unchanged"""
+        key = (
+            task.task_id, title, color, getattr(task, "updated_time", None),
+            task.summary, task.status, task.due_time, task.url
+        )
+        card = self._card_cache.get(key)
+        if card is None:
+            card = _dumps(self._build_task_card(task, title, color))
+            self._card_cache.set(key, card)
+        return card
+    
+    def _load_hashes(self) -> Dict[str, str]:
+        """Content hashes of the last digest sent per target, loaded on first use"""
+        if self._hashes is None:
+            self._hashes = _read_state("digest_hashes.json")
+        return self._hashes
+    
+    def _save_hashes(self):
+        """Persist digest hashes"""
+        _write_state("digest_hashes.json", self._load_hashes())
+    
+    def _load_schedule(self) -> Dict[str, Dict]:
+        """Per-digest {last_sent_ts, last_change_count, ema}, loaded on first use"""
+        if self._schedule is None:
+            self._schedule = _read_state("digest_schedule.json")
+        return self._schedule
+    
+    def _should_send_now(self, kind: str, key: str) -> bool:
+        """Whether the digest `key` is due, given how busy its tasks have been"""
+        entry = self._load_schedule().get(key)
+        if not entry:
+            return True
+        interval = _DIGEST_INTERVALS[kind] / (1 + entry["ema"] / _SCHEDULE_K)
+        elapsed = time.time() - entry["last_sent_ts"]
+        return elapsed >= max(interval - _SCHEDULE_SLACK, 0)
+    
+    def _record_digest(self, key: str, tasks: List):
+        """Fold the tasks changed since the previous digest into the schedule"""
+        schedule = self._load_schedule()
+        entry = schedule.get(key)
+        if not entry:
+            # No previous digest to measure against: counting every task
+            # ever updated would inflate the average and shorten the interval
+            schedule[key] = {"last_sent_ts": time.time(), "last_change_count": 0, "ema": 0.0}
+        else:
+            since = datetime.fromtimestamp(entry["last_sent_ts"], timezone.utc)
+            changes = sum(
+                1 for t in tasks
+                if getattr(t, "updated_time", None) and _parse_iso(t.updated_time) > since
+            )
+            schedule[key] = {
+                "last_sent_ts": time.time(),
+                "last_change_count": changes,
+                "ema": _SCHEDULE_ALPHA * changes + (1 - _SCHEDULE_ALPHA) * entry["ema"],
+            }
+        try:
+            _write_state("digest_schedule.json", schedule)
+        except OSError as e:
+            print(f"Warning: could not save digest schedule: {e}")
+    
+    def _send_digest(
+        self,
+        key: str,
+        target: str,
+        content: Dict,
+        force: bool = False
+    ) -> Optional[bool]:
+        """Send a digest card unless it is identical to the last one sent for `key`
+        
+        Returns True once sent, None when skipped as unchanged (never with
+        `force`), and False if the send failed.
+        """
+        payload = _dumps(content)
+        digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+        
+        hashes = self._load_hashes()
+        if not force and hashes.get(key) == digest:
+            print(f"Digest unchanged since last send, skipped ({key})")
+            return None
+        
+        if not self._send_message(target, payload):
+            return False
+        hashes[key] = digest
+        try:
+            self._save_hashes()
+        except OSError as e:
+            print(f"Warning: could not save digest hashes: {e}")
+        return True
+    
     def remind_due_soon(self, assignee: Optional[str] = None, days: int = 1) -> List[str]:
         """Send reminders for tasks due soon"""
         target = assignee or os.getenv("FEISHU_USER_ID")
         if not target:
             print("Error: No assignee specified")
             return []
+        _check_open_id(target)
+        
+        from lark_oapi.api.task.v2 import ListTaskRequest
         
         # Get tasks due soon
         due_before = (datetime.now() + timedelta(days=days)).isoformat()
-        request = ListTaskRequest.builder() \
-            .assignee(target) \
-            .due_before(due_before) \
-            .statuses(["todo", "in_progress"]) \
-            .page_size(50) \
-            .build()
-        
-        response = self.client.task.v2.task.list(request)
-        if not response.success():
-            print(f"Error fetching tasks: {response.msg}")
-            return []
-        
-        tasks = response.data.items
+        tasks = self._list_all(
+            lambda: ListTaskRequest.builder()
+            .assignee(target)
+            .due_before(due_before)
+            .statuses(["todo", "in_progress"])
+            .page_size(50)
+        )
         if not tasks:
             return []
         
@@ -151,6 +473,26 @@ class TaskNotifier:
             return [t.task_id for t in tasks]
         return []
     
+    def remind_due_soon_many(self, assignees: List[str], days: int = 1) -> Dict[str, List[str]]:
+        """Send due-soon reminders to several assignees concurrently
+        
+        Returns the reminded task IDs keyed by assignee. Every ID is
+        validated before any request is made. An assignee whose reminder
+        raises (e.g. a connection error) gets [] rather than aborting the rest.
+        """
+        for assignee in assignees:
+            _check_open_id(assignee)
+        pool = self._executor()
+        futures = [pool.submit(self.remind_due_soon, a, days) for a in assignees]
+        results = {}
+        for assignee, future in zip(assignees, futures):
+            try:
+                results[assignee] = future.result()
+            except Exception as e:
+                print(f"Error reminding {assignee}: {e}")
+                results[assignee] = []
+        return results
+    
     def notify_task_assigned(
         self,
         task_id: str,
@@ -158,17 +500,15 @@ class TaskNotifier:
         assigner_name: str = ""
     ) -> bool:
         """Notify user when task is assigned to them"""
-        # Get task details
-        request = GetTaskRequest.builder().task_id(task_id).build()
-        response = self.client.task.v2.task.get(request)
-        
-        if not response.success():
+        _check_task_id(task_id)
+        _check_open_id(assignee)
+        task = self._get_task(task_id)
+        if task is None:
             return False
         
-        task = response.data.task
         from_text = f"来自 {assigner_name} 的" if assigner_name else ""
         
-        content = self._build_task_card(
+        content = self._task_card_json(
             task,
             f"📋 {from_text}新任务分配",
             "blue"
@@ -176,77 +516,162 @@ class TaskNotifier:
         
         return self._send_message(assignee, content)
     
+    def _followers_chat(self, followers: List[str]) -> Optional[str]:
+        """chat_id of the bot's followers group chat, if every follower is in it
+        
+        Lookups are cached for a few minutes. A failed lookup (e.g. the app
+        lacks the im:chat scope) is cached as "no chat" for the same time, so
+        it is not retried, and reported, on every completion.
+        """
+        from lark_oapi.api.im.v1 import GetChatMembersRequest, ListChatRequest
+        
+        chat_id = self._chat_cache.get("chat")
+        if chat_id is None:
+            # Stops paging as soon as the chat is found
+            chats = self._iter_all(
+                lambda: ListChatRequest.builder().page_size(100),
+                self.client.im.v1.chat.list
+            )
+            try:
+                chat_id = next(
+                    (chat.chat_id for chat in chats if chat.name == _FOLLOWERS_CHAT_NAME),
+                    ""
+                )
+            except RuntimeError as e:
+                print(f"Error fetching list: {e}")
+                chat_id = ""
+            self._chat_cache.set("chat", chat_id)
+        if not chat_id:
+            return None
+        
+        members = self._chat_cache.get(("members", chat_id))
+        if members is None:
+            items = self._list_all(
+                lambda: GetChatMembersRequest.builder()
+                    .chat_id(chat_id)
+                    .member_id_type("open_id")
+                    .page_size(100),
+                self.client.im.v1.chat_members.get
+            )
+            # A failed lookup counts as an empty chat, i.e. DM everyone
+            members = frozenset(member.member_id for member in items or [])
+            self._chat_cache.set(("members", chat_id), members)
+        
+        # Anyone missing from the chat would never see the notice
+        return chat_id if members.issuperset(followers) else None
+    
     def notify_task_completed(
         self,
         task_id: str,
-        notify_followers: bool = True
+        notify_followers: bool = True,
+        group_chat_id: Optional[str] = None
     ) -> bool:
-        """Notify followers when task is completed"""
-        request = GetTaskRequest.builder().task_id(task_id).build()
-        response = self.client.task.v2.task.get(request)
-        
-        if not response.success():
+        """Notify followers when task is completed
+        
+        With `group_chat_id`, or when the task has several followers who are
+        all members of the bot's chat named FEISHU_FOLLOWERS_CHAT
+        ("task-followers"), a single message goes to that chat instead of
+        one DM per follower.
+        """
+        _check_task_id(task_id)
+        task = self._get_task(task_id)
+        if task is None:
             return False
         
-        task = response.data.task
-        
         if not notify_followers or not task.followers:
             return False
         
-        content = self._build_task_card(
+        # Serialized once (and cached) for every follower
+        content = self._task_card_json(
             task,
             "✅ 任务已完成",
             "green"
         )
         
-        success = True
-        for follower in task.followers:
-            if not self._send_message(follower, content):
-                success = False
+        if not group_chat_id and len(task.followers) >= _GROUP_NOTIFY_MIN_FOLLOWERS:
+            group_chat_id = self._followers_chat(task.followers)
         
-        return success
+        if group_chat_id:
+            results = [self._send_message(group_chat_id, content, receive_id_type="chat_id")]
+        else:
+            # Send to all followers concurrently; every send runs even if one fails
+            results = list(self._executor().map(
+                lambda follower: self._send_message(follower, content),
+                task.followers
+            ))
+        # The task just changed state; don't serve this snapshot again
+        self._task_cache.pop(task_id)
+        return all(results)
     
     def send_daily_digest(
         self,
         assignee: Optional[str] = None,
-        include_completed: bool = False
+        include_completed: bool = False,
+        force: bool = False,
+        delta: bool = False
     ) -> bool:
-        """Send daily task summary"""
+        """Send daily task summary
+        
+        Unless `force` is set, the digest is only sent once it is due under
+        the adaptive schedule (sooner when many tasks have been changing).
+        With `delta`, only changes since the previous delta digest are sent
+        (nothing at all when there are none).
+        """
         target = assignee or os.getenv("FEISHU_USER_ID")
         if not target:
             print("Error: No assignee specified")
             return False
+        _check_open_id(target)
+        
+        # Delta digests keep their own schedule and hash, so running both
+        # modes for one target doesn't make either skip the other
+        key = f"daily-delta:{target}" if delta else f"daily:{target}"
+        if not force and not self._should_send_now("daily", key):
+            print(f"Daily digest for {target} not due yet (use --force to send anyway)")
+            return True
+        
+        from lark_oapi.api.task.v2 import ListTaskRequest
         
         # Get all tasks
         statuses = ["todo", "in_progress"]
         if include_completed:
             statuses.append("completed")
         
-        request = ListTaskRequest.builder() \
-            .assignee(target) \
-            .statuses(statuses) \
-            .page_size(100) \
-            .build()
-        
-        response = self.client.task.v2.task.list(request)
-        if not response.success():
+        # Overdue tasks come from their own server-filtered query, fetched
+        # concurrently with the full listing
+        now = datetime.now(timezone.utc)
+        pool = self._executor()
+        all_future = pool.submit(
+            self._list_all,
+            lambda: ListTaskRequest.builder()
+            .assignee(target)
+            .statuses(statuses)
+            .page_size(100)
+        )
+        overdue_future = pool.submit(
+            self._list_all,
+            lambda: ListTaskRequest.builder()
+            .assignee(target)
+            .statuses(["todo", "in_progress"])
+            .due_before(now.isoformat())
+            .page_size(100)
+        )
+        tasks, overdue = all_future.result(), overdue_future.result()
+        if tasks is None or overdue is None:
             return False
         
-        tasks = response.data.items
+        if delta:
+            return self._send_delta_digest(
+                key, target, tasks, overdue, include_completed
+            )
         
-        # Categorize
-        todo = [t for t in tasks if t.status == "todo"]
-        in_progress = [t for t in tasks if t.status == "in_progress"]
-        completed = [t for t in tasks if t.status == "completed"]
-        
-        # Find overdue
-        now = datetime.now()
-        overdue = [
-            t for t in tasks
-            if t.status in ["todo", "in_progress"]
-            and t.due_time
-            and datetime.fromisoformat(t.due_time.replace("Z", "+00:00")) < now
-        ]
+        # Categorize in a single pass
+        todo, in_progress, completed = [], [], []
+        buckets = {"todo": todo, "in_progress": in_progress, "completed": completed}
+        for t in tasks:
+            bucket = buckets.get(t.status)
+            if bucket is not None:
+                bucket.append(t)
         
         content = {
             "config": {"wide_screen_mode": True},
@@ -271,7 +696,9 @@ class TaskNotifier:
         }
         
         if overdue:
-            overdue_list = "\n".join([f"• {t.summary}" for t in overdue[:5]])
+            # The five most overdue, without sorting the whole list
+            most_overdue = heapq.nsmallest(5, overdue, key=lambda t: _parse_iso(t.due_time))
+            overdue_list = "\n".join([f"• {t.summary}" for t in most_overdue])
             if len(overdue) > 5:
                 overdue_list += f"\n... and {len(overdue) - 5} more"
             
@@ -284,51 +711,149 @@ class TaskNotifier:
                 }
             })
         
-        return self._send_message(target, content)
+        sent = self._send_digest(key, target, content, force)
+        if sent is False:
+            return False
+        if sent:
+            # Only a digest that actually went out advances the schedule
+            self._record_digest(key, tasks)
+        return True
+    
+    def _send_delta_digest(
+        self,
+        key: str,
+        target: str,
+        tasks: List,
+        overdue: List,
+        include_completed: bool = False
+    ) -> bool:
+        """Send only what changed since the last snapshot of `target`'s tasks
+        
+        The snapshot maps task_id -> [status, due_time, overdue] and is
+        replaced atomically after a successful send. Listings with and
+        without completed tasks are snapshotted separately, so toggling
+        `include_completed` doesn't report completed tasks as added/removed.
+        """
+        suffix = "-all" if include_completed else ""
+        name = f"snapshot-{target}{suffix}.json"
+        previous = _read_state(name)
+        overdue_ids = {t.task_id for t in overdue}
+        current = {
+            t.task_id: [t.status, t.due_time, t.task_id in overdue_ids]
+            for t in tasks
+        }
+        
+        added, changed, newly_overdue = [], [], []
+        for t in tasks:
+            before = previous.get(t.task_id)
+            if before is None:
+                added.append(t)
+                continue
+            if before[:2] != current[t.task_id][:2]:
+                changed.append(t)
+            if current[t.task_id][2] and not before[2]:
+                newly_overdue.append(t)
+        removed = len(previous.keys() - current.keys())
+        
+        if not (added or changed or newly_overdue or removed):
+            print(f"No task changes since the last digest for {target}, skipped")
+            return True
+        
+        sections = [
+            ("🆕 新任务", added),
+            ("🔄 状态变化", changed),
+            ("⚠️ 新逾期", newly_overdue),
+        ]
+        summary = "\n".join(f"**{label}**: {len(items)}" for label, items in sections)
+        summary += f"\n**📤 已移出**: {removed}"
+        content = {
+            "config": {"wide_screen_mode": True},
+            "header": {
+                "title": {"tag": "plain_text", "content": "📊 每日任务变化"},
+                "template": "blue"
+            },
+            "elements": [
+                {"tag": "div", "text": {"tag": "lark_md", "content": summary}}
+            ]
+        }
+        for label, items in sections:
+            if not items:
+                continue
+            item_list = "\n".join([f"• {t.summary}" for t in items[:5]])
+            if len(items) > 5:
+                item_list += f"\n... and {len(items) - 5} more"
+            content["elements"].append({"tag": "hr"})
+            content["elements"].append({
+                "tag": "div",
+                "text": {"tag": "lark_md", "content": f"**{label}**:\n{item_list}"}
+            })
+        
+        # The empty-delta check above already deduplicates; two different
+        # deltas can render identical cards, so the hash check is bypassed
+        if not self._send_digest(key, target, content, force=True):
+            return False
+        try:
+            _write_state(name, current)
+        except OSError as e:
+            print(f"Warning: could not save task snapshot: {e}")
+        self._record_digest(key, tasks)
+        return True
     
     def send_weekly_report(
         self,
         assignee: Optional[str] = None,
-        tasklist_id: Optional[str] = None
+        tasklist_id: Optional[str] = None,
+        force: bool = False
     ) -> bool:
-        """Send weekly task report"""
+        """Send weekly task report
+        
+        Unless `force` is set, the report is only sent once it is due under
+        the adaptive schedule (sooner when many tasks have been changing).
+        """
         target = assignee or os.getenv("FEISHU_USER_ID")
         if not target:
             print("Error: No assignee specified")
             return False
+        _check_open_id(target)
+        
+        key = f"weekly:{target}:{tasklist_id or ''}"
+        if not force and not self._should_send_now("weekly", key):
+            print(f"Weekly report for {target} not due yet (use --force to send anyway)")
+            return True
+        
+        from lark_oapi.api.task.v2 import ListTaskRequest, ListTaskTasklistRequest
         
         # Get tasks from this week
-        week_ago = (datetime.now() - timedelta(days=7)).isoformat()
+        week_ago = datetime.now(timezone.utc) - timedelta(days=7)
         
         if tasklist_id:
-            request = ListTaskTasklistRequest.builder() \
-                .tasklist_id(tasklist_id) \
-                .page_size(100) \
-                .build()
-            response = self.client.task.v2.tasklist.list_task(request)
+            tasks = self._list_all(
+                lambda: ListTaskTasklistRequest.builder()
+                .tasklist_id(tasklist_id)
+                .page_size(100),
+                self.client.task.v2.tasklist.list_task
+            )
         else:
-            request = ListTaskRequest.builder() \
-                .assignee(target) \
-                .page_size(100) \
-                .build()
-            response = self.client.task.v2.task.list(request)
+            tasks = self._list_all(
+                lambda: ListTaskRequest.builder()
+                .assignee(target)
+                .page_size(100)
+            )
         
-        if not response.success():
+        if tasks is None:
             return False
         
-        tasks = response.data.items
-        
         # Filter to this week's activity
         recent_completed = [
             t for t in tasks
             if t.status == "completed"
             and t.completed_time
-            and datetime.fromisoformat(t.completed_time.replace("Z", "+00:00")) > datetime.fromisoformat(week_ago)
+            and _parse_iso(t.completed_time) > week_ago
         ]
         
         recent_created = [
             t for t in tasks
-            if datetime.fromisoformat(t.created_time.replace("Z", "+00:00")) > datetime.fromisoformat(week_ago)
+            if t.created_time and _parse_iso(t.created_time) > week_ago
         ]
         
         content = {
@@ -353,7 +878,8 @@ class TaskNotifier:
         }
         
         if recent_completed:
-            completed_list = "\n".join([f"✅ {t.summary}" for t in recent_completed[:5]])
+            latest = heapq.nlargest(5, recent_completed, key=lambda t: _parse_iso(t.completed_time))
+            completed_list = "\n".join([f"✅ {t.summary}" for t in latest])
             content["elements"].append({"tag": "hr"})
             content["elements"].append({
                 "tag": "div",
@@ -363,13 +889,56 @@ class TaskNotifier:
                 }
             })
         
-        return self._send_message(target, content)
+        sent = self._send_digest(key, target, content, force)
+        if sent is False:
+            return False
+        if sent:
+            # Only a digest that actually went out advances the schedule
+            self._record_digest(key, tasks)
+        return True
+
+
+def _run_command(notifier: TaskNotifier, args):
+    """Execute one parsed CLI command"""
+    try:
+        if args.command == "due-soon":
+            notifier.remind_due_soon(args.assignee, args.days)
+        
+        elif args.command == "due-soon-batch":
+            with open(args.assignees_file, encoding="utf-8") as f:
+                stripped = (line.strip() for line in f)
+                assignees = [line for line in stripped if line and not line.startswith("#")]
+            results = notifier.remind_due_soon_many(assignees, args.days)
+            print(f"Reminded {sum(1 for ids in results.values() if ids)}/{len(assignees)} assignees")
+        
+        elif args.command == "daily":
+            notifier.send_daily_digest(
+                args.assignee, args.include_completed, force=args.force, delta=args.delta
+            )
+        
+        elif args.command == "weekly":
+            notifier.send_weekly_report(args.assignee, args.tasklist, force=args.force)
+        
+        elif args.command == "notify-assigned":
+            success = notifier.notify_task_assigned(args.task, args.assignee, args.assigner)
+            print(f"Notification {'sent' if success else 'failed'}")
+        
+        elif args.command == "notify-completed":
+            success = notifier.notify_task_completed(args.task, group_chat_id=args.group_chat)
+            print(f"Notification {'sent' if success else 'failed'}")
+    except ValueError as e:
+        print(f"Error: {e}")
 
 
 if __name__ == "__main__":
     import argparse
+    import shlex
     
     parser = argparse.ArgumentParser(description="Feishu Task Notifier")
+    parser.add_argument(
+        "--serve", action="store_true",
+        help="Read commands from stdin, one per line, reusing one client and connection pool"
+    )
     subparsers = parser.add_subparsers(dest="command")
     
     # Due soon reminder
@@ -377,15 +946,23 @@ if __name__ == "__main__":
     due_soon.add_argument("--assignee", help="Assignee open_id")
     due_soon.add_argument("--days", type=int, default=1, help="Days until due")
     
+    # Due soon reminders for many assignees
+    due_soon_batch = subparsers.add_parser("due-soon-batch", help="Send due soon reminders to many assignees")
+    due_soon_batch.add_argument("--assignees-file", required=True, help="File with one assignee open_id per line")
+    due_soon_batch.add_argument("--days", type=int, default=1, help="Days until due")
+    
     # Daily digest
     daily = subparsers.add_parser("daily", help="Send daily digest")
     daily.add_argument("--assignee", help="Assignee open_id")
     daily.add_argument("--include-completed", action="store_true")
+    daily.add_argument("--force", action="store_true", help="Send even if not due yet")
+    daily.add_argument("--delta", action="store_true", help="Only report changes since the last delta digest")
     
     # Weekly report
     weekly = subparsers.add_parser("weekly", help="Send weekly report")
     weekly.add_argument("--assignee", help="Assignee open_id")
     weekly.add_argument("--tasklist", help="Tasklist ID")
+    weekly.add_argument("--force", action="store_true", help="Send even if not due yet")
     
     # Notify assigned
     notify = subparsers.add_parser("notify-assigned", help="Notify task assigned")
@@ -393,9 +970,14 @@ if __name__ == "__main__":
     notify.add_argument("--assignee", required=True, help="Assignee open_id")
     notify.add_argument("--assigner", default="", help="Assigner name")
     
+    # Notify completed
+    completed = subparsers.add_parser("notify-completed", help="Notify followers a task is completed")
+    completed.add_argument("--task", required=True, help="Task ID")
+    completed.add_argument("--group-chat", help="Send one message to this chat_id instead of DMs")
+    
     args = parser.parse_args()
     
-    if not args.command:
+    if not args.command and not args.serve:
         parser.print_help()
         sys.exit(1)
     
@@ -405,15 +987,22 @@ if __name__ == "__main__":
         print(f"Error: {e}")
         sys.exit(1)
     
-    if args.command == "due-soon":
-        notifier.remind_due_soon(args.assignee, args.days)
-    
-    elif args.command == "daily":
-        notifier.send_daily_digest(args.assignee, args.include_completed)
-    
-    elif args.command == "weekly":
-        notifier.send_weekly_report(args.assignee, args.tasklist)
-    
-    elif args.command == "notify-assigned":
-        success = notifier.notify_task_assigned(args.task, args.assignee, args.assigner)
-        print(f"Notification {'sent' if success else 'failed'}")
+    if not args.serve:
+        _run_command(notifier, args)
+    else:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                line_args = parser.parse_args(shlex.split(line))
+                if line_args.command:
+                    _run_command(notifier, line_args)
+            except SystemExit:
+                # argparse has already reported the error; keep serving
+                pass
+            except Exception as e:
+                # One bad command (unbalanced quotes, API or file error)
+                # must not stop the server
+                print(f"Error: {e}")
+            sys.stdout.flush()